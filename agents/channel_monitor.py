@@ -6,10 +6,12 @@ AI 사용: ❌ (순수 스크래핑)
 """
 import logging
 import asyncio
+from typing import Any, Dict, List, Optional
 
+from config.settings import get_settings
 from db.channels import get_active_channels
-from db.video_queue import video_exists, register_video, get_subtitle_recheck_targets, update_subtitle_status
-from services.youtube import get_latest_videos, parse_upload_date
+from db.video_queue import get_existing_video_ids, register_video, get_subtitle_recheck_targets, update_subtitle_status
+from services.youtube import commit_feed_state, get_latest_videos_batch, parse_upload_date
 from services.transcript import check_subtitle_available
 
 logger = logging.getLogger(__name__)
@@ -19,94 +21,70 @@ async def run() -> dict:
     """
     채널 모니터 에이전트 메인 루프
 
+    1) 모든 채널을 동시에 스크래핑
+    2) 전 채널의 영상 ID를 모아 한 번에 중복 조회
+    3) 신규 영상만 자막 확인 후 등록
+
     Returns:
         실행 결과 요약 dict
     """
     logger.info("═══ 채널 모니터 에이전트 시작 ═══")
 
     channels = await get_active_channels()
-    logger.info(f"활성 채널 {len(channels)}개 조회")
-
-    new_count = 0
-    skip_count = 0
-    error_count = 0
-
-    for idx, channel in enumerate(channels):
-        try:
-            logger.info(
-                f"[{idx + 1}/{len(channels)}] 채널 스크래핑: "
-                f"{channel['name']} (키워드: {channel['keyword']})"
-            )
-
-            videos = await get_latest_videos(
-                channel["url"], keyword=channel["keyword"]
-            )
-
-            if not videos:
-                logger.info(f"  → 매칭 영상 없음")
+    logger.info("활성 채널 %d개 조회", len(channels))
+
+    # 1) 채널 단위 동시 실행 — 그룹 단위 대기 없이 끝난 채널의 슬롯을 즉시 재사용
+    #    RSS 피드가 마지막 스크래핑 이후 그대로면 채널 페이지 스크래핑 생략
+    s = get_settings()
+    results = await get_latest_videos_batch(
+        [(channel["url"], channel["keyword"]) for channel in channels],
+        concurrency=s.scheduler.monitor_concurrency,
+        skip_if_unchanged=True,
+    )
+    scraped = [
+        _check_scrape_result(idx, len(channels), channel, result)
+        for idx, (channel, result) in enumerate(zip(channels, results))
+    ]
+    error_count = sum(1 for videos in scraped if videos is None)
+
+    # 2) 채널별이 아닌 전체 영상 ID를 한 번에 중복 조회
+    #    (여러 채널에 걸린 같은 영상은 먼저 나온 채널 기준으로 한 번만 처리)
+    candidates: Dict[str, tuple] = {}
+    found_count = 0
+    for channel, videos in zip(channels, scraped):
+        for video in videos or []:
+            video_id = video.get("video_id", "")
+            if not video_id:
                 continue
-
-            # ⚠️ 주의: youtube-transcript-api는 너무 빠른 병렬 요청 시 429 에러 발생 가능
-            # 따라서 Semaphore를 1로 두어 자막 확인 시 일정 간격을 두도록 함
-            sem = asyncio.Semaphore(1)
-
-            async def process_video(video: dict) -> dict:
-                async with sem:
-                    video_id = video.get("video_id", "")
-                    if not video_id:
-                        return {"status": "invalid"}
-
-                    # 중복 체크
-                    if await video_exists(video_id):
-                        return {"status": "skipped"}
-
-                    # 자막 존재 여부 빠른 체크 (youtube-transcript-api 네트워크 I/O)
-                    subtitle_status = await check_subtitle_available(video_id)
-                    await asyncio.sleep(1.5)  # 429 Too Many Requests 방지용 딜레이
-
-                    # 업로드 날짜 변환
-                    upload_dt = parse_upload_date(video.get("upload_date", ""))
-
-                    # 영상 큐 DB에 등록
-                    result = await register_video({
-                        "title": video["title"],
-                        "video_id": video_id,
-                        "channel_name": channel["name"],
-                        "upload_date": upload_dt.isoformat(),
-                        "video_length": video.get("video_length", "Unknown"),
-                        "url": video["url"],
-                        "subtitle_status": subtitle_status,
-                    })
-
-                    if result:
-                        return {"status": "registered", "title": video["title"], "subtitle": subtitle_status}
-                    else:
-                        return {"status": "error"}
-
-            tasks = [process_video(v) for v in videos]
-            results = await asyncio.gather(*tasks)
-
-            for res in results:
-                if res["status"] == "skipped":
-                    skip_count += 1
-                elif res["status"] == "registered":
-                    new_count += 1
-                    logger.info(f"  ✓ 신규 등록: {res['title']} (자막: {res['subtitle']})")
-                elif res["status"] == "error":
-                    error_count += 1
-
-            # 채널 간 API 부하 분산
-            if idx < len(channels) - 1:
-                await asyncio.sleep(2)
-
-        except Exception as e:
-            error_count += 1
-            logger.error(f"  ✗ 채널 처리 오류: {e}")
-            if idx < len(channels) - 1:
-                await asyncio.sleep(2)
+            found_count += 1
+            candidates.setdefault(video_id, (channel, video))
+
+    existing_ids = await get_existing_video_ids(list(candidates))
+    new_items = [
+        (channel, video)
+        for video_id, (channel, video) in candidates.items()
+        if video_id not in existing_ids
+    ]
+    skip_count = found_count - len(new_items)
+
+    # 3) 신규 영상 등록 — youtube-transcript-api 429 방지용 호출 간격은
+    #    services.transcript의 RateLimiter가 관리
+    #    이번 주기에 자막을 확인한 video_id는 기록해 두고 재확인에서 제외
+    checked_this_tick: Dict[str, str] = {}
+    results = await asyncio.gather(
+        *[_register_new_video(channel, video, checked_this_tick) for channel, video in new_items]
+    )
+    new_count = sum(1 for ok in results if ok)
+    error_count += sum(1 for ok in results if not ok)
+
+    # 모든 영상이 등록(또는 기존재)된 채널만 피드 상태를 확정 — 실패한 영상이 있으면 다음 회차에 다시 스크래핑
+    failed_ids = {video["video_id"] for (_, video), ok in zip(new_items, results) if not ok}
+    for channel, videos in zip(channels, scraped):
+        if videos is not None and not any(v.get("video_id") in failed_ids for v in videos):
+            commit_feed_state(channel["url"], channel["keyword"])
 
     # 자막 미확인 영상 재확인
-    recheck_count = await _recheck_subtitle_status()
+    recheck_count = await _recheck_subtitle_status(checked_this_tick)
 
     summary = {
         "channels_checked": len(channels),
@@ -115,29 +93,91 @@ async def run() -> dict:
         "subtitle_rechecked": recheck_count,
         "errors": error_count,
     }
-    logger.info(f"═══ 채널 모니터 완료: {summary} ═══")
+    logger.info("═══ 채널 모니터 완료: %s ═══", summary)
     return summary
 
 
-async def _recheck_subtitle_status() -> int:
-    """자막상태가 미확인이거나, 분석필요이지만 자막상태가 N인 영상들을 재확인합니다."""
-    targets = await get_subtitle_recheck_targets()
+def _check_scrape_result(idx: int, total: int, channel: dict, result: Any) -> Optional[List[dict]]:
+    """채널 하나의 스크래핑 결과를 로그로 남기고 영상 목록을 반환합니다. 오류 시 None."""
+    if isinstance(result, BaseException):
+        logger.error(
+            "  ✗ 채널 처리 오류 (%s): %s", channel["name"], result,
+            exc_info=(type(result), result, result.__traceback__),
+        )
+        return None
+
+    logger.info(
+        "[%d/%d] 채널 스크래핑: %s (키워드: %s) — %d건",
+        idx + 1, total, channel["name"], channel["keyword"], len(result),
+    )
+    return result
+
+
+async def _register_new_video(channel: dict, video: dict, checked: Dict[str, str]) -> bool:
+    """신규 영상의 자막 여부를 확인하고 영상 큐 DB에 등록합니다. 확인 결과는 checked에 기록합니다."""
+    try:
+        video_id = video["video_id"]
+
+        # 자막 존재 여부 빠른 체크 (youtube-transcript-api 네트워크 I/O)
+        subtitle_status = await check_subtitle_available(video_id)
+        checked[video_id] = subtitle_status
+
+        # 업로드 날짜 변환
+        upload_dt = parse_upload_date(video.get("upload_date", ""))
+
+        # 영상 큐 DB에 등록
+        result = await register_video({
+            "title": video["title"],
+            "video_id": video_id,
+            "channel_name": channel["name"],
+            "upload_date": upload_dt.isoformat(),
+            "video_length": video.get("video_length", "Unknown"),
+            "url": video["url"],
+            "subtitle_status": subtitle_status,
+        })
+
+        if not result:
+            return False
+
+        logger.info("  ✓ 신규 등록: %s (자막: %s)", video['title'], subtitle_status)
+        return True
+
+    except Exception as e:
+        logger.exception("  ✗ 영상 등록 오류 (%s): %s — %s", channel['name'], video.get('title', ''), e)
+        return False
+
+
+async def _recheck_subtitle_status(checked: Dict[str, str]) -> int:
+    """
+    자막상태가 미확인이거나, 분석필요이지만 자막상태가 N인 영상들을 재확인합니다.
+    checked에 있는 영상(이번 주기에 이미 확인)은 같은 결과가 나올 것이므로 건너뜁니다.
+    """
+    targets = [
+        video for video in await get_subtitle_recheck_targets()
+        if video.get("video_id") not in checked
+    ]
     if not targets:
         return 0
 
-    logger.info(f"자막 재확인 대상: {len(targets)}건")
-    updated = 0
+    logger.info("자막 재확인 대상: %d건", len(targets))
 
-    for video in targets:
+    # 호출 간격은 services.transcript의 RateLimiter가, 동시 요청 수는 세마포어가 제한
+    sem = asyncio.Semaphore(get_settings().scheduler.monitor_concurrency)
+
+    async def _recheck(video: dict) -> bool:
         video_id = video.get("video_id", "")
         old_status = video.get("subtitle_status", "")
         if not video_id:
-            continue
+            return False
+
+        async with sem:
+            new_status = await check_subtitle_available(video_id)
+        if new_status == old_status:
+            return False
 
-        new_status = await check_subtitle_available(video_id)
-        if new_status != old_status:
-            await update_subtitle_status(video["page_id"], new_status)
-            updated += 1
-            logger.info(f"  자막상태 업데이트: {video['title']} ({old_status} → {new_status})")
+        await update_subtitle_status(video["page_id"], new_status)
+        logger.info("  자막상태 업데이트: %s (%s → %s)", video['title'], old_status, new_status)
+        return True
 
-    return updated
+    results = await asyncio.gather(*[_recheck(video) for video in targets])
+    return sum(1 for changed in results if changed)
@@ -11,7 +11,7 @@ from typing import List
 from pydantic import BaseModel, Field
 
 from config.settings import get_settings
-from db.video_queue import get_pending_filter_videos, update_analysis_needed
+from db.video_queue import get_pending_filter_videos, update_analysis_needed_batch
 from services.llm import get_llm_service
 
 logger = logging.getLogger(__name__)
@@ -67,13 +67,13 @@ async def run() -> dict:
     s = get_settings()
     now = datetime.now(KST)
     if not (s.scheduler.filter_active_hour_start <= now.hour < s.scheduler.filter_active_hour_end):
-        logger.info(f"필터링 에이전트: 비활성 시간대 ({now.hour}시). 스킵.")
+        logger.info("필터링 에이전트: 비활성 시간대 (%d시). 스킵.", now.hour)
         return {"status": "skipped", "reason": "inactive_hours"}
 
     logger.info("═══ 필터링 에이전트 시작 ═══")
 
     videos = await get_pending_filter_videos()
-    logger.info(f"필터링 대상: {len(videos)}건")
+    logger.info("필터링 대상: %d건", len(videos))
 
     if not videos:
         return {"status": "done", "total": 0, "needed": 0, "not_needed": 0}
@@ -92,11 +92,10 @@ async def run() -> dict:
     not_needed = 0
     needed = 0
 
-    # 짧은 영상 일괄 처리
+    # 짧은 영상 일괄 처리 (UPDATE 한 번)
+    not_needed += await update_analysis_needed_batch([v["page_id"] for v in short_videos], "불필요")
     for video in short_videos:
-        await update_analysis_needed(video["page_id"], "불필요")
-        not_needed += 1
-        logger.info(f"  → 10분 이하, 불필요: {video['title']} ({video['video_length']})")
+        logger.info("  → 10분 이하, 불필요: %s (%s)", video['title'], video['video_length'])
 
     # LLM 배치 처리
     if llm_candidates:
@@ -124,20 +123,25 @@ async def run() -> dict:
             # 결과를 video_id 기준으로 매핑
             decision_map = {d.video_id: d for d in result.decisions}
 
+            # 판정별로 page_id를 모아 상태당 UPDATE 한 번으로 반영
+            needed_ids: List[str] = []
+            not_needed_ids: List[str] = []
+
             for video in llm_candidates:
                 decision = decision_map.get(video["video_id"])
                 if decision and decision.result == "필요":
-                    await update_analysis_needed(video["page_id"], "필요")
-                    needed += 1
-                    logger.info(f"  ✓ 분석 필요: {video['title']} ({decision.reason})")
+                    needed_ids.append(video["page_id"])
+                    logger.info("  ✓ 분석 필요: %s (%s)", video['title'], decision.reason)
                 else:
                     reason = decision.reason if decision else "LLM 응답 누락"
-                    await update_analysis_needed(video["page_id"], "불필요")
-                    not_needed += 1
-                    logger.info(f"  ✗ 분석 불필요: {video['title']} ({reason})")
+                    not_needed_ids.append(video["page_id"])
+                    logger.info("  ✗ 분석 불필요: %s (%s)", video['title'], reason)
+
+            needed += await update_analysis_needed_batch(needed_ids, "필요")
+            not_needed += await update_analysis_needed_batch(not_needed_ids, "불필요")
 
         except Exception as e:
-            logger.error(f"  ✗ LLM 배치 필터링 오류: {e}")
+            logger.exception("  ✗ LLM 배치 필터링 오류: %s", e)
             # 실패 시 모두 미정 유지
             return {
                 "status": "error",
@@ -153,7 +157,7 @@ async def run() -> dict:
         "needed": needed,
         "not_needed": not_needed,
     }
-    logger.info(f"═══ 필터링 완료: {summary} ═══")
+    logger.info("═══ 필터링 완료: %s ═══", summary)
     return summary
 
 
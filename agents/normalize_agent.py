@@ -11,8 +11,13 @@ from zoneinfo import ZoneInfo
 
 from config.settings import get_settings
 from config.prompts import NORMALIZE_SYSTEM_PROMPT, NORMALIZE_USER_PROMPT_TEMPLATE
-from db.stock_opinions import get_unprocessed_opinions, get_normalized_names, update_normalization
-from services.llm import get_llm_service
+from db.stock_opinions import (
+    count_unprocessed_opinions,
+    get_unprocessed_opinions,
+    get_normalized_names,
+    update_normalization,
+)
+from services.llm import LLMResponseError, get_llm_service
 
 logger = logging.getLogger(__name__)
 KST = ZoneInfo("Asia/Seoul")
@@ -32,9 +37,8 @@ async def run() -> dict:
     global _last_run_time
     s = get_settings()
 
-    # 미처리 레코드 확인
-    unprocessed = await get_unprocessed_opinions()
-    count = len(unprocessed)
+    # 미처리 레코드 수 확인 (트리거 판단에는 건수만 필요 — 레코드 조회는 트리거 충족 후)
+    count = await count_unprocessed_opinions()
 
     # 트리거 조건 체크
     now = datetime.now(KST)
@@ -50,8 +54,8 @@ async def run() -> dict:
 
     if not batch_trigger and not time_trigger:
         logger.info(
-            f"정규화 에이전트: 트리거 미충족 "
-            f"(미처리 {count}개, 배치 기준 {s.scheduler.normalize_batch_size}개)"
+            "정규화 에이전트: 트리거 미충족 (미처리 %d개, 배치 기준 %d개)",
+            count, s.scheduler.normalize_batch_size,
         )
         return {"status": "skipped", "unprocessed": count}
 
@@ -60,15 +64,18 @@ async def run() -> dict:
         _last_run_time = now
         return {"status": "done", "total": 0}
 
-    logger.info(f"═══ 정규화 에이전트 시작 (미처리 {count}건) ═══")
+    logger.info("═══ 정규화 에이전트 시작 (미처리 %d건) ═══", count)
     _last_run_time = now
 
+    unprocessed = await get_unprocessed_opinions()
+    count = len(unprocessed)
+
     # 기존 정규화 완료 목록 가져오기
     existing_names = await get_normalized_names()
-    logger.info(f"기존 정규화 완료 종목: {len(existing_names)}개")
+    logger.info("기존 정규화 완료 종목: %d개", len(existing_names))
 
     # 원본 종목명 추출 (중복 제거로 LLM 프롬프트 효율화)
-    target_names = list(set([op["original_name"] for op in unprocessed if op["original_name"]]))
+    target_names = list({op["original_name"] for op in unprocessed if op["original_name"]})
 
     if not target_names:
         return {"status": "done", "total": 0}
@@ -81,7 +88,13 @@ async def run() -> dict:
         target_names="\n".join(f"- {n}" for n in target_names),
     )
 
-    result = await llm.generate_json(NORMALIZE_SYSTEM_PROMPT, user_prompt)
+    try:
+        result = await llm.generate_json(NORMALIZE_SYSTEM_PROMPT, user_prompt)
+    except LLMResponseError as e:
+        # 응답을 해석하지 못했으면 원본명으로 '완료' 처리하지 않고 미처리로 남겨 다음 주기에 재시도
+        logger.error("정규화 LLM 응답 파싱 실패: %s", e)
+        return {"status": "error", "total": count, "error": str(e)}
+
     results_list = result.get("results", [])
 
     # 결과 매핑 (원본명 → 정규화 결과)
@@ -113,12 +126,12 @@ async def run() -> dict:
             else:
                 manual_check += 1
 
-            logger.info(f"  {orig_name} → {normalized} ({status})")
+            logger.info("  %s → %s (%s)", orig_name, normalized, status)
         else:
             # LLM 응답에 없는 경우 → 원본 그대로, 완료 처리
             await update_normalization(opinion["page_id"], orig_name, "완료")
             completed += 1
-            logger.info(f"  {orig_name} → {orig_name} (신규, 자동 완료)")
+            logger.info("  %s → %s (신규, 자동 완료)", orig_name, orig_name)
 
     summary = {
         "status": "done",
@@ -126,5 +139,5 @@ async def run() -> dict:
         "completed": completed,
         "manual_check": manual_check,
     }
-    logger.info(f"═══ 정규화 완료: {summary} ═══")
+    logger.info("═══ 정규화 완료: %s ═══", summary)
     return summary
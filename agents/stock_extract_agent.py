@@ -4,14 +4,16 @@
 자막 → LLM 분석 → 종목의견 DB 직행 + 영상 요약을 영상 큐 DB에 저장.
 AI 사용: ✅ (Gemini Structured Output)
 """
+import asyncio
 import logging
+import re
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from config.prompts import EXTRACT_SYSTEM_PROMPT
-from db.video_queue import get_ready_for_report_videos, mark_analysis_done, update_summary
+from db.video_queue import get_ready_for_report_videos, complete_analysis
 from db.stock_opinions import create_stock_opinions_batch
-from services.llm import get_llm_service
+from services.llm import MAX_CONCURRENT_REQUESTS, get_llm_service
 from services.transcript import get_transcript
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,18 @@ class ExtractionResult(BaseModel):
     stocks: List[StockOpinion] = Field(description="추출된 종목 의견 리스트. 종목이 없으면 빈 리스트.")
 
 
+# 자막 수집(프로듀서)과 LLM 분석(워커)을 큐로 분리해 두 I/O를 겹쳐 실행
+# 워커 수는 LLM 동시 실행 한도와 같은 값을 사용 (더 많으면 세마포어 대기만 늘어남)
+_ANALYSIS_WORKERS = MAX_CONCURRENT_REQUESTS
+_QUEUE_MAXSIZE = 2 * _ANALYSIS_WORKERS
+
+# LLM 호출 전 사전 필터: 너무 짧거나 한국어가 아닌 자막은 분석할 종목 의견이 없음
+_MIN_TRANSCRIPT_CHARS = 500
+_LANGUAGE_SAMPLE_CHARS = 2000
+_MIN_HANGUL_RATIO = 0.2
+_HANGUL = re.compile(r"[\uac00-\ud7a3]")
+
+
 async def run() -> dict:
     """
     종목 추출 에이전트 메인 루프
@@ -44,28 +58,85 @@ async def run() -> dict:
     logger.info("═══ 종목 추출 에이전트 시작 ═══")
 
     videos = await get_ready_for_report_videos()
-    logger.info(f"추출 대상: {len(videos)}건")
+    logger.info("추출 대상: %d건", len(videos))
 
     if not videos:
-        return {"status": "done", "total": 0, "success": 0, "failed": 0}
+        return {"status": "done", "total": 0, "success": 0, "failed": 0, "skipped": 0}
 
     llm = get_llm_service()
-    success = 0
-    failed = 0
+    stats = {"success": 0, "failed": 0, "skipped": 0}
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
 
-    for video in videos:
+    async def _produce() -> None:
         try:
-            logger.info(f"종목 추출 중: {video['title']}")
+            for video in videos:
+                logger.info("종목 추출 중: %s", video['title'])
+                try:
+                    transcript = await get_transcript(video["video_id"])
+                except Exception as e:
+                    logger.exception("  ✗ 자막 오류: %s — %s", video['title'], e)
+                    transcript = None
+
+                if not transcript:
+                    logger.warning("  → 자막 가져오기 실패: %s", video['title'])
+                    stats["failed"] += 1
+                    continue
+
+                # 분석 가치 없는 자막은 LLM을 호출하지 않고 완료 처리 (다음 주기에 다시 받지 않도록)
+                skip_reason = _skip_reason(transcript)
+                if skip_reason:
+                    await complete_analysis(video["page_id"])
+                    stats["skipped"] += 1
+                    logger.info("  → 분석 생략 (%s): %s", skip_reason, video['title'])
+                    continue
+
+                # 큐가 가득 차면 워커가 따라올 때까지 대기 (자막이 메모리에 쌓이지 않도록)
+                await queue.put((video, transcript))
+        finally:
+            for _ in range(_ANALYSIS_WORKERS):
+                await queue.put(None)
+
+    async def _consume() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            video, transcript = item
+            if await _analyze_video(llm, video, transcript):
+                stats["success"] += 1
+            else:
+                stats["failed"] += 1
+
+    await asyncio.gather(_produce(), *(_consume() for _ in range(_ANALYSIS_WORKERS)))
+
+    summary = {
+        "status": "done",
+        "total": len(videos),
+        "success": stats["success"],
+        "failed": stats["failed"],
+        "skipped": stats["skipped"],
+    }
+    logger.info("═══ 종목 추출 완료: %s ═══", summary)
+    return summary
 
-            # 1. 자막 전체 가져오기
-            transcript = await get_transcript(video["video_id"])
-            if not transcript:
-                logger.warning(f"  → 자막 가져오기 실패: {video['title']}")
-                failed += 1
-                continue
 
-            # 2. LLM으로 종목 추출 + 요약 (Structured Output)
-            user_prompt = f"""## 영상 정보
+def _skip_reason(transcript: str) -> Optional[str]:
+    """LLM 분석을 생략할 자막이면 사유를, 분석 대상이면 None을 반환합니다."""
+    if len(transcript) < _MIN_TRANSCRIPT_CHARS:
+        return f"자막 {len(transcript)}자"
+
+    # 앞부분 표본의 한글 음절 비율로 언어 판별 (전체 스캔 불필요)
+    sample = transcript[:_LANGUAGE_SAMPLE_CHARS]
+    if len(_HANGUL.findall(sample)) < len(sample) * _MIN_HANGUL_RATIO:
+        return "한국어 아님"
+    return None
+
+
+async def _analyze_video(llm, video: dict, transcript: str) -> bool:
+    """자막을 LLM으로 분석해 요약과 종목의견을 저장합니다. 성공 여부를 반환합니다."""
+    try:
+        # 1. LLM으로 종목 추출 + 요약 (Structured Output)
+        user_prompt = f"""## 영상 정보
 - 제목: {video['title']}
 - 채널: {video.get('channel_name', '')}
 
@@ -74,48 +145,42 @@ async def run() -> dict:
 
 위 스크립트를 분석하여 종목 의견과 영상 요약을 추출해주세요."""
 
-            result: ExtractionResult = await llm.generate_structured(
-                EXTRACT_SYSTEM_PROMPT,
-                user_prompt,
-                ExtractionResult,
-            )
-
-            # 3. 영상 요약을 영상 큐 DB에 저장
-            if result.summary:
-                await update_summary(video["page_id"], result.summary)
-                logger.info(f"  요약 저장: {result.summary[:50]}...")
-
-            # 4. 종목의견 DB에 각 종목별 레코드 생성 (중복 제거 로직 추가)
-            if result.stocks:
-                unique_opinions = {}
-                for stock in result.stocks:
-                    if stock.name not in unique_opinions:
-                        unique_opinions[stock.name] = {
-                            "name": stock.name,
-                            "opinion_type": stock.opinion_type,
-                            "recommender": stock.recommender or video.get("channel_name", ""),
-                            "reason_summary": stock.reason_summary,
-                            "upload_date": video.get("upload_date", ""),
-                            "video_id": video["video_id"],
-                        }
-                opinions = list(unique_opinions.values())
-                created = await create_stock_opinions_batch(opinions)
-                logger.info(f"  종목의견 {created}/{len(opinions)}개 생성")
-
-            # 5. 영상 큐의 분석완료 = True
-            await mark_analysis_done(video["page_id"])
-            success += 1
-            logger.info(f"  ✓ 추출 완료: {video['title']} (종목 {len(result.stocks)}개)")
-
-        except Exception as e:
-            logger.error(f"  ✗ 추출 오류: {video['title']} — {e}")
-            failed += 1
-
-    summary = {
-        "status": "done",
-        "total": len(videos),
-        "success": success,
-        "failed": failed,
-    }
-    logger.info(f"═══ 종목 추출 완료: {summary} ═══")
-    return summary
+        result: ExtractionResult = await llm.generate_structured(
+            EXTRACT_SYSTEM_PROMPT,
+            user_prompt,
+            ExtractionResult,
+        )
+
+        # 2. 종목의견 DB에 각 종목별 레코드 생성 (중복 제거 로직 추가)
+        if result.stocks:
+            # 영상 단위로 고정된 필드는 한 번만 만들고 종목별로 병합
+            video_fields = {
+                "upload_date": video.get("upload_date", ""),
+                "video_id": video["video_id"],
+            }
+            default_recommender = video.get("channel_name", "")
+
+            unique_opinions = {}
+            for stock in result.stocks:
+                if stock.name not in unique_opinions:
+                    unique_opinions[stock.name] = {
+                        **video_fields,
+                        "name": stock.name,
+                        "opinion_type": stock.opinion_type,
+                        "recommender": stock.recommender or default_recommender,
+                        "reason_summary": stock.reason_summary,
+                    }
+            opinions = list(unique_opinions.values())
+            created = await create_stock_opinions_batch(opinions)
+            logger.info("  종목의견 %d/%d개 생성", created, len(opinions))
+
+        # 3. 영상 요약 저장 + 분석완료 = True (UPDATE 한 번)
+        await complete_analysis(video["page_id"], result.summary)
+        if result.summary:
+            logger.info("  요약 저장: %s...", result.summary[:50])
+        logger.info("  ✓ 추출 완료: %s (종목 %d개)", video['title'], len(result.stocks))
+        return True
+
+    except Exception as e:
+        logger.exception("  ✗ 추출 오류: %s — %s", video['title'], e)
+        return False
@@ -23,24 +23,28 @@ class LLMConfig:
     api_key: str = ""
     temperature: float = 0.0
     max_tokens: int = 8192
+    requests_per_minute: int = 0      # 분당 최대 요청 수 (0 = 제한 없음)
 
 
 @dataclass
 class SchedulerConfig:
     """에이전트별 스케줄링 주기"""
     monitor_interval_minutes: int = 10
+    monitor_concurrency: int = 3
     filter_interval_minutes: int = 60
     filter_active_hour_start: int = 7
     filter_active_hour_end: int = 20
     report_interval_minutes: int = 5
     normalize_batch_size: int = 10
     normalize_interval_minutes: int = 60
+    normalize_check_interval_minutes: int = 10   # 트리거 조건 확인 주기
 
 
 @dataclass
 class YouTubeConfig:
     """YouTube 스크래핑 관련 설정"""
     proxy_url: str = ""
+    transcript_min_interval_seconds: float = 1.5  # youtube-transcript-api 호출 최소 간격 (429 방지)
 
 
 @dataclass
@@ -51,6 +55,7 @@ class Settings:
     scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
     youtube: YouTubeConfig = field(default_factory=YouTubeConfig)
     log_level: str = "INFO"
+    thread_pool_workers: int = 32     # asyncio.to_thread 기본 스레드풀 크기 (자막 조회·동기 LLM SDK 호출)
 
 
 # ──────────────────────────────────────────────
@@ -76,20 +81,25 @@ def get_settings() -> Settings:
             api_key=os.getenv("LLM_API_KEY", ""),
             temperature=float(os.getenv("LLM_TEMPERATURE", "0")),
             max_tokens=int(os.getenv("LLM_MAX_TOKENS", "8192")),
+            requests_per_minute=int(os.getenv("LLM_REQUESTS_PER_MINUTE", "0")),
         ),
         scheduler=SchedulerConfig(
             monitor_interval_minutes=int(os.getenv("MONITOR_INTERVAL_MINUTES", "10")),
+            monitor_concurrency=int(os.getenv("MONITOR_CONCURRENCY", "3")),
             filter_interval_minutes=int(os.getenv("FILTER_INTERVAL_MINUTES", "60")),
             filter_active_hour_start=int(os.getenv("FILTER_ACTIVE_HOUR_START", "7")),
             filter_active_hour_end=int(os.getenv("FILTER_ACTIVE_HOUR_END", "20")),
             report_interval_minutes=int(os.getenv("REPORT_INTERVAL_MINUTES", "5")),
             normalize_batch_size=int(os.getenv("NORMALIZE_BATCH_SIZE", "10")),
             normalize_interval_minutes=int(os.getenv("NORMALIZE_INTERVAL_MINUTES", "60")),
+            normalize_check_interval_minutes=int(os.getenv("NORMALIZE_CHECK_INTERVAL_MINUTES", "10")),
         ),
         youtube=YouTubeConfig(
             proxy_url=os.getenv("YOUTUBE_PROXY_URL", ""),
+            transcript_min_interval_seconds=float(os.getenv("TRANSCRIPT_MIN_INTERVAL_SECONDS", "1.5")),
         ),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        thread_pool_workers=int(os.getenv("THREAD_POOL_WORKERS", "32")),
     )
     return _settings
 
@@ -3,58 +3,68 @@
 SQLite 채널 테이블에서 활성 채널 목록을 조회합니다.
 """
 import logging
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import Row
 from sqlalchemy.future import select
 
 from db.database import get_session_maker, Channel
 
 logger = logging.getLogger(__name__)
 
+# 채널 목록은 거의 바뀌지 않으므로 모니터 주기마다 DB를 다시 읽지 않도록 TTL 캐시
+# (채널 테이블은 별도 프로세스인 migrate_notion_to_sqlite.py만 수정하므로, 변경은 최대 TTL 후 반영)
+_ACTIVE_CACHE_TTL = 300.0
+_active_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+
+# ──────────────────────────────────────────────
+# 변환 헬퍼
+# ──────────────────────────────────────────────
+# ORM 엔티티 대신 필요한 컬럼만 Row로 조회 (identity map/상태 추적 비용 없음)
+_COLUMNS = (Channel.page_id, Channel.name, Channel.url, Channel.keyword, Channel.active)
+
+
+def _to_dict(ch: Row) -> Dict[str, Any]:
+    return {
+        "page_id": ch.page_id,
+        "name": ch.name,
+        "url": ch.url,
+        "keyword": ch.keyword,
+        "active": ch.active,
+    }
+
 
 async def get_active_channels() -> List[Dict[str, Any]]:
     """활성화된 채널 목록을 조회하여 정리된 딕셔너리 리스트로 반환합니다."""
+    global _active_cache
+    if _active_cache is not None:
+        cached_at, cached = _active_cache
+        if time.monotonic() - cached_at < _ACTIVE_CACHE_TTL:
+            return [dict(ch) for ch in cached]
+
     session_maker = get_session_maker()
     channels = []
     
     async with session_maker() as session:
-        stmt = select(Channel).where(Channel.active == True)
+        stmt = select(*_COLUMNS).where(Channel.active == True)
         result = await session.execute(stmt)
-        channel_objs = result.scalars().all()
         
-        for ch in channel_objs:
-            channel = {
-                "page_id": ch.page_id,
-                "name": ch.name,
-                "url": ch.url,
-                "keyword": ch.keyword,
-                "active": ch.active,
-            }
-            if channel["url"]:
-                channels.append(channel)
+        for ch in result.all():
+            if ch.url:
+                channels.append(_to_dict(ch))
             else:
-                logger.warning(f"채널 '{channel['name']}' — URL 누락, 스킵")
+                logger.warning(f"채널 '{ch.name}' — URL 누락, 스킵")
 
     logger.info(f"활성 채널 {len(channels)}개 조회")
-    return channels
+    _active_cache = (time.monotonic(), channels)
+    # 호출부가 dict를 수정해도 캐시가 바뀌지 않도록 항목 단위로 복사해서 반환
+    return [dict(ch) for ch in channels]
 
 
 async def get_all_channels() -> List[Dict[str, Any]]:
     """모든 채널을 조회합니다."""
     session_maker = get_session_maker()
-    channels = []
-    
     async with session_maker() as session:
-        stmt = select(Channel)
-        result = await session.execute(stmt)
-        channel_objs = result.scalars().all()
-        
-        for ch in channel_objs:
-            channels.append({
-                "page_id": ch.page_id,
-                "name": ch.name,
-                "url": ch.url,
-                "keyword": ch.keyword,
-                "active": ch.active,
-            })
-            
-    return channels
+        result = await session.execute(select(*_COLUMNS))
+        return [_to_dict(ch) for ch in result.all()]
@@ -4,7 +4,7 @@ SQLite 데이터베이스 연결 및 SQLAlchemy ORM 모델 정의
 import logging
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column
-from sqlalchemy import String, Integer, Boolean, Text, DateTime, func
+from sqlalchemy import String, Integer, Boolean, Text, DateTime, func, event
 
 logger = logging.getLogger(__name__)
 
@@ -61,10 +61,25 @@ class StockOpinion(Base):
 _engine = None
 _async_session_maker = None
 
+def _set_sqlite_pragma(dbapi_conn, _connection_record):
+    """
+    동시 실행 에이전트(채널 병렬 등록, 추출 워커)의 쓰기가 겹쳐도
+    'database is locked' 없이 처리되도록 연결마다 SQLite 설정을 적용합니다.
+    - WAL: 읽기가 쓰기를 막지 않음
+    - busy_timeout: 쓰기 락 경합 시 즉시 실패하지 않고 대기
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
 async def init_db(database_url: str):
     global _engine, _async_session_maker
     if _engine is None:
         _engine = create_async_engine(database_url, echo=False)
+        if database_url.startswith("sqlite"):
+            event.listen(_engine.sync_engine, "connect", _set_sqlite_pragma)
         _async_session_maker = async_sessionmaker(
             _engine, expire_on_commit=False, class_=AsyncSession
         )
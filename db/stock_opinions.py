@@ -8,12 +8,21 @@ from datetime import datetime, timedelta
 import dateutil.parser
 from typing import Dict, List, Any, Optional
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import update, func
 
 from db.database import get_session_maker, StockOpinion
 
 logger = logging.getLogger(__name__)
 
+# 집계 대상 의견 유형 (그 외 값은 "관심"으로 취급)
+_OPINION_TYPES = frozenset({"추천", "주의", "관심"})
+
+# 신규 종목의견 레코드의 고정 초기 상태 (정규화 에이전트가 이후 채움)
+_NEW_OPINION_DEFAULTS: Dict[str, Any] = {
+    "normalized_name": "",
+    "normalization_status": "미처리",
+}
+
 
 # ──────────────────────────────────────────────
 # 변환 헬퍼
@@ -39,6 +48,20 @@ def _truncate(text: str, max_len: int) -> str:
 # ──────────────────────────────────────────────
 # 생성
 # ──────────────────────────────────────────────
+def _new_opinion(opinion: Dict[str, Any]) -> StockOpinion:
+    """종목 의견 dict로 새 StockOpinion 엔티티를 만듭니다."""
+    return StockOpinion(
+        **_NEW_OPINION_DEFAULTS,
+        page_id=f"so_{uuid.uuid4().hex[:8]}_{opinion.get('video_id', '')}",
+        original_name=opinion.get("name", ""),
+        opinion_type=opinion.get("opinion_type", "추천"),
+        recommender=opinion.get("recommender", ""),
+        reason_summary=_truncate(opinion.get("reason_summary", ""), 2000),
+        upload_date=opinion.get("upload_date", ""),
+        video_id=opinion.get("video_id", ""),
+    )
+
+
 async def create_stock_opinion(opinion: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     종목의견 DB에 새 레코드를 생성합니다.
@@ -53,20 +76,9 @@ async def create_stock_opinion(opinion: Dict[str, Any]) -> Optional[Dict[str, An
             - video_id: 원본 영상 ID
     """
     session_maker = get_session_maker()
-    fake_page_id = f"so_{uuid.uuid4().hex[:8]}_{opinion.get('video_id', '')}"
-    
+
     async with session_maker() as session:
-        new_opinion = StockOpinion(
-            page_id=fake_page_id,
-            original_name=opinion.get("name", ""),
-            normalized_name="",
-            normalization_status="미처리",
-            opinion_type=opinion.get("opinion_type", "추천"),
-            recommender=opinion.get("recommender", ""),
-            reason_summary=_truncate(opinion.get("reason_summary", ""), 2000),
-            upload_date=opinion.get("upload_date", ""),
-            video_id=opinion.get("video_id", "")
-        )
+        new_opinion = _new_opinion(opinion)
         session.add(new_opinion)
         await session.commit()
         await session.refresh(new_opinion)
@@ -78,15 +90,19 @@ async def create_stock_opinion(opinion: Dict[str, Any]) -> Optional[Dict[str, An
 async def create_stock_opinions_batch(
     opinions: List[Dict[str, Any]],
 ) -> int:
-    """여러 종목의견을 일괄 생성합니다. 생성 성공 수를 반환합니다."""
-    # Notion API와 달리 로컬 DB는 빠르므로 하나씩 넣어도 무방
-    success_count = 0
+    """여러 종목의견을 한 세션·한 트랜잭션으로 일괄 생성합니다. 생성 건수를 반환합니다."""
+    if not opinions:
+        return 0
+
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        session.add_all([_new_opinion(opinion) for opinion in opinions])
+        await session.commit()
+
     for opinion in opinions:
-        result = await create_stock_opinion(opinion)
-        if result:
-            success_count += 1
-    logger.info(f"종목의견 배치 생성: {success_count}/{len(opinions)} 성공")
-    return success_count
+        logger.info(f"종목의견 생성: {opinion.get('name', '')} ({opinion.get('opinion_type', '')})")
+    logger.info(f"종목의견 배치 생성: {len(opinions)}건")
+    return len(opinions)
 
 
 # ──────────────────────────────────────────────
@@ -101,19 +117,34 @@ async def get_unprocessed_opinions() -> List[Dict[str, Any]]:
         return [_to_dict(so) for so in result.scalars().all()]
 
 
+async def count_unprocessed_opinions() -> int:
+    """정규화_상태=미처리인 종목의견 수를 반환합니다. (레코드는 읽지 않음)"""
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        stmt = select(func.count()).select_from(StockOpinion).where(
+            StockOpinion.normalization_status == "미처리"
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+
 async def get_normalized_names() -> List[str]:
     """정규화 완료된 종목명 목록을 반환합니다."""
     session_maker = get_session_maker()
-    names = set()
     async with session_maker() as session:
-        stmt = select(StockOpinion.normalized_name).where(
-            StockOpinion.normalization_status == "완료"
+        # 중복 제거·빈 값 제외·정렬을 SQL에서 처리 — 의견 행 수가 아닌 종목 수만큼만 전송
+        stmt = (
+            select(StockOpinion.normalized_name)
+            .where(
+                StockOpinion.normalization_status == "완료",
+                StockOpinion.normalized_name.is_not(None),
+                StockOpinion.normalized_name != "",
+            )
+            .distinct()
+            .order_by(StockOpinion.normalized_name)
         )
         result = await session.execute(stmt)
-        for name in result.scalars().all():
-            if name:
-                names.add(name)
-    return sorted(list(names))
+        return list(result.scalars().all())
 
 
 async def get_all_opinions() -> List[Dict[str, Any]]:
@@ -148,6 +179,16 @@ async def update_normalization(
 # ──────────────────────────────────────────────
 # 시각화 데이터 조회 (3D Frontend)
 # ──────────────────────────────────────────────
+_VIZ_COLUMNS = (
+    StockOpinion.normalized_name,
+    StockOpinion.opinion_type,
+    StockOpinion.recommender,
+    StockOpinion.reason_summary,
+    StockOpinion.video_id,
+    StockOpinion.upload_date,
+)
+
+
 async def get_visualization_data(days: int = 3, interval_hours: int = 12) -> Dict[str, Any]:
     """3D 렌더링용 시각화 데이터를 시간대 버킷별로 조회합니다."""
     session_maker = get_session_maker()
@@ -158,13 +199,14 @@ async def get_visualization_data(days: int = 3, interval_hours: int = 12) -> Dic
     cutoff_iso = cutoff_date.isoformat()
 
     async with session_maker() as session:
-        stmt = select(StockOpinion).where(
+        # 집계에 쓰는 컬럼만 Row로 조회 (ORM 엔티티 생성/identity map 비용 없음)
+        stmt = select(*_VIZ_COLUMNS).where(
             StockOpinion.normalization_status == "완료",
             StockOpinion.upload_date >= cutoff_iso
         ).order_by(StockOpinion.upload_date.desc())
         
         result = await session.execute(stmt)
-        opinions = result.scalars().all()
+        opinions = result.all()
 
         total_agg = {}
         timeline_agg = {}
@@ -174,7 +216,7 @@ async def get_visualization_data(days: int = 3, interval_hours: int = 12) -> Dic
             if not name:
                 continue
                 
-            op_type = op.opinion_type if op.opinion_type in ["추천", "주의", "관심"] else "관심"
+            op_type = op.opinion_type if op.opinion_type in _OPINION_TYPES else "관심"
             
             # total agg
             if name not in total_agg:
@@ -193,7 +235,12 @@ async def get_visualization_data(days: int = 3, interval_hours: int = 12) -> Dic
             # timeline agg
             try:
                 # 업로드 시간 파싱 (ISO 8601 -> datetime)
-                op_date = dateutil.parser.parse(op.upload_date)
+                # 저장 값은 isoformat() 출력이므로 C 구현 fromisoformat으로 충분,
+                # 그 밖의 형식(Notion 이관 데이터 등)만 dateutil로 처리
+                try:
+                    op_date = datetime.fromisoformat(op.upload_date)
+                except ValueError:
+                    op_date = dateutil.parser.parse(op.upload_date)
                 if op_date.tzinfo is not None:
                     # offset-aware면 naive local time으로 변환
                     op_date = op_date.astimezone().replace(tzinfo=None)
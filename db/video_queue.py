@@ -3,14 +3,20 @@
 SQLite 데이터베이스에서 영상 등록, 중복 체크, 상태 업데이트 등을 처리합니다.
 """
 import logging
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Set
 from sqlalchemy.future import select
 from sqlalchemy import or_, and_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from db.database import get_session_maker, VideoQueue
 
 logger = logging.getLogger(__name__)
 
+# 영상 큐 레코드는 삭제되지 않으므로, 한 번 존재가 확인된 video_id는
+# 프로세스 수명 동안 캐시하여 매 모니터 주기의 중복 조회를 생략
+_known_video_ids: Set[str] = set()
+
 
 # ──────────────────────────────────────────────
 # 변환 헬퍼
@@ -62,13 +68,38 @@ async def get_all_videos() -> List[Dict[str, Any]]:
         return [_to_dict(v) for v in result.scalars().all()]
 
 
-async def video_exists(video_id: str) -> bool:
-    """영상 ID로 중복 여부를 확인합니다."""
+async def get_existing_video_ids(video_ids: List[str]) -> Set[str]:
+    """주어진 영상 ID 중 이미 등록된 ID 집합을 한 번의 쿼리로 반환합니다.
+    캐시에 있는 ID는 조회하지 않고, 나머지만 DB에 확인합니다."""
+    ids = {vid for vid in video_ids if vid}
+    known = ids & _known_video_ids
+    misses = ids - known
+    if not misses:
+        return known
+
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        stmt = select(VideoQueue.video_id).where(VideoQueue.video_id.in_(misses))
+        result = await session.execute(stmt)
+        found = set(result.scalars().all())
+
+    _known_video_ids.update(found)
+    return known | found
+
+
+async def warm_video_id_cache(days: int = 7) -> int:
+    """최근 days일 내 등록된 video_id를 한 번에 읽어 중복 체크 캐시를 채웁니다.
+    모니터는 최근 영상만 스크래핑하므로 이 범위면 첫 주기부터 캐시가 적중합니다."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     session_maker = get_session_maker()
     async with session_maker() as session:
-        stmt = select(VideoQueue).where(VideoQueue.video_id == video_id)
+        stmt = select(VideoQueue.video_id).where(VideoQueue.created_at >= cutoff)
         result = await session.execute(stmt)
-        return result.scalars().first() is not None
+        ids = {vid for vid in result.scalars().all() if vid}
+
+    _known_video_ids.update(ids)
+    logger.info(f"영상 ID 캐시 워밍: {len(ids)}건 (최근 {days}일)")
+    return len(ids)
 
 
 async def get_subtitle_recheck_targets() -> List[Dict[str, Any]]:
@@ -105,31 +136,45 @@ async def get_ready_for_report_videos() -> List[Dict[str, Any]]:
 # ──────────────────────────────────────────────
 # 생성
 # ──────────────────────────────────────────────
+# 신규 영상 레코드에서 호출마다 달라지지 않는 초기 상태 (register_video에서 병합)
+_NEW_VIDEO_DEFAULTS: Dict[str, Any] = {
+    "analysis_needed": "미정",
+    "analysis_done": False,
+    "summary": "",
+}
+
+
 async def register_video(video_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """영상 큐 DB에 새 영상을 등록합니다."""
+    """
+    영상 큐 DB에 새 영상을 등록합니다.
+    video_id UNIQUE 제약에 기대는 INSERT OR IGNORE로 처리하므로, 이미 등록된 영상이면
+    (재시작 직후·동시 등록 경합 포함) 예외 없이 None을 반환합니다.
+    """
     session_maker = get_session_maker()
-    
+    video_id = video_data.get("video_id", "")
+
     # page_id는 Notion 시절 잔재이지만, 로컬 DB에서는 단순히 vq_{video_id} 형태로 할당해 고유성을 줍니다.
-    fake_page_id = f"vq_{video_data.get('video_id', '')}"
-    
+    values = _NEW_VIDEO_DEFAULTS | {
+        "page_id": f"vq_{video_id}",
+        "title": video_data.get("title", ""),
+        "video_id": video_id,
+        "channel_name": video_data.get("channel_name", "기타"),
+        "upload_date": video_data.get("upload_date", ""),
+        "video_length": video_data.get("video_length", "Unknown"),
+        "url": video_data.get("url", ""),
+        "subtitle_status": video_data.get("subtitle_status", "미확인"),
+    }
+
     async with session_maker() as session:
-        new_video = VideoQueue(
-            page_id=fake_page_id,
-            title=video_data.get("title", ""),
-            video_id=video_data.get("video_id", ""),
-            channel_name=video_data.get("channel_name", "기타"),
-            upload_date=video_data.get("upload_date", ""),
-            video_length=video_data.get("video_length", "Unknown"),
-            url=video_data.get("url", ""),
-            subtitle_status=video_data.get("subtitle_status", "미확인"),
-            analysis_needed="미정",
-            analysis_done=False,
-            summary=""
-        )
-        session.add(new_video)
+        stmt = sqlite_insert(VideoQueue).values(**values).on_conflict_do_nothing()
+        result = await session.execute(stmt)
         await session.commit()
-        await session.refresh(new_video)
-        return _to_dict(new_video)
+
+    _known_video_ids.add(video_id)
+    if result.rowcount == 0:
+        logger.debug("이미 등록된 영상: %s", video_id)
+        return None
+    return values
 
 
 # ──────────────────────────────────────────────
@@ -145,31 +190,32 @@ async def update_subtitle_status(page_id: str, status: str) -> bool:
     return True
 
 
-async def update_analysis_needed(page_id: str, status: str) -> bool:
-    """분석필요를 업데이트합니다. (미정 / 필요 / 불필요)"""
-    session_maker = get_session_maker()
-    async with session_maker() as session:
-        stmt = update(VideoQueue).where(VideoQueue.page_id == page_id).values(analysis_needed=status)
-        await session.execute(stmt)
-        await session.commit()
-    return True
-
+async def update_analysis_needed_batch(page_ids: List[str], status: str) -> int:
+    """여러 영상의 분석필요를 한 번의 UPDATE로 변경합니다. 실제로 갱신된 행 수를 반환합니다."""
+    if not page_ids:
+        return 0
 
-async def mark_analysis_done(page_id: str) -> bool:
-    """분석완료를 True로 변경합니다."""
     session_maker = get_session_maker()
     async with session_maker() as session:
-        stmt = update(VideoQueue).where(VideoQueue.page_id == page_id).values(analysis_done=True)
-        await session.execute(stmt)
+        stmt = (
+            update(VideoQueue)
+            .where(VideoQueue.page_id.in_(page_ids))
+            .values(analysis_needed=status)
+        )
+        result = await session.execute(stmt)
         await session.commit()
-    return True
+    return result.rowcount
+
 
+async def complete_analysis(page_id: str, summary: Optional[str] = None) -> bool:
+    """요약 저장과 분석완료 처리를 한 번의 UPDATE로 수행합니다. summary가 비어 있으면 요약은 그대로 둡니다."""
+    values: Dict[str, Any] = {"analysis_done": True}
+    if summary:
+        values["summary"] = summary[:2000]
 
-async def update_summary(page_id: str, summary: str) -> bool:
-    """영상 요약을 업데이트합니다."""
     session_maker = get_session_maker()
     async with session_maker() as session:
-        stmt = update(VideoQueue).where(VideoQueue.page_id == page_id).values(summary=summary[:2000])
+        stmt = update(VideoQueue).where(VideoQueue.page_id == page_id).values(**values)
         await session.execute(stmt)
         await session.commit()
     return True
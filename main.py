@@ -1,13 +1,18 @@
 """
 투자 의사결정 지원 시스템 — FastAPI 서버 + 스케줄러
 """
+import asyncio
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -19,6 +24,8 @@ from db.channels import get_all_channels
 from db.video_queue import get_all_videos
 from db.stock_opinions import get_all_opinions, get_visualization_data
 from db.database import init_db
+from db.video_queue import warm_video_id_cache
+from services.youtube import close_client as close_youtube_client
 
 # ──────────────────────────────────────────────
 # 로깅 설정 (콘솔 + 파일)
@@ -43,7 +50,13 @@ file_handler = TimedRotatingFileHandler(
 )
 file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
 
-logging.basicConfig(level=logging.INFO, handlers=[console_handler, file_handler])
+# 코루틴은 큐에 레코드만 넣고, 실제 콘솔/파일 쓰기는 리스너 스레드가 담당
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+
+# 기본 INFO, 운영에서는 LOG_LEVEL=WARNING으로 진행 로그를 생략
+logging.basicConfig(level=get_settings().log_level.upper(), handlers=[QueueHandler(log_queue)])
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 # ──────────────────────────────────────────────
@@ -80,10 +93,10 @@ def setup_scheduler():
         replace_existing=True,
     )
 
-    # ④ 정규화 에이전트 — 10분 주기 (트리거 조건은 내부 체크)
+    # ④ 정규화 에이전트 — 기본 10분 주기 (트리거 조건은 내부 체크)
     scheduler.add_job(
         normalize_agent.run,
-        IntervalTrigger(minutes=10),
+        IntervalTrigger(minutes=s.scheduler.normalize_check_interval_minutes),
         id="normalize_agent",
         replace_existing=True,
     )
@@ -93,7 +106,7 @@ def setup_scheduler():
     logger.info(f"  채널 모니터: {s.scheduler.monitor_interval_minutes}분 주기")
     logger.info(f"  필터링: {s.scheduler.filter_interval_minutes}분 주기 ({s.scheduler.filter_active_hour_start}~{s.scheduler.filter_active_hour_end}시)")
     logger.info(f"  종목 추출: {s.scheduler.report_interval_minutes}분 주기")
-    logger.info(f"  정규화: 10분 주기 (배치 {s.scheduler.normalize_batch_size}개 또는 {s.scheduler.normalize_interval_minutes}분)")
+    logger.info(f"  정규화: {s.scheduler.normalize_check_interval_minutes}분 주기 (배치 {s.scheduler.normalize_batch_size}개 또는 {s.scheduler.normalize_interval_minutes}분)")
 
 
 # ──────────────────────────────────────────────
@@ -102,13 +115,33 @@ def setup_scheduler():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     s = get_settings()
+
+    # Python 3.12+: gather로 만든 태스크가 첫 await 전까지 즉시 실행되어
+    # 캐시 적중 등 바로 끝나는 코루틴은 이벤트 루프 스케줄링을 거치지 않음
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # asyncio.to_thread 풀 크기 고정 — 기본값(min(32, CPU+4))은 소형 컨테이너에서 작아
+    # 동시 자막 조회·동기 LLM 호출이 스레드를 기다리며 직렬화됨
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=s.thread_pool_workers, thread_name_prefix="to_thread")
+    )
+
     await init_db(s.db.url)
+    await warm_video_id_cache()
     setup_scheduler()
     yield
     scheduler.shutdown()
+    await close_youtube_client()
+    log_listener.stop()
 
 
-app = FastAPI(title="투자 의사결정 지원 시스템", lifespan=lifespan)
+# 조회 API(/queue, /opinions, /api/visualization)는 응답이 크므로 orjson으로 직렬화
+app = FastAPI(
+    title="투자 의사결정 지원 시스템",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -3,19 +3,32 @@ LLM 추상 레이어
 config/settings.py의 LLM_PROVIDER / LLM_MODEL 설정에 따라
 Gemini, OpenAI, Anthropic 중 하나를 사용합니다.
 """
+import re
 import json
 import logging
 import asyncio
-from typing import Optional, Type, TypeVar
+import functools
+from typing import AsyncIterator, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
 from config.settings import get_settings, LLMConfig
+from utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
-# 요청 제한: 동시 2개까지
-_SEMAPHORE = asyncio.Semaphore(2)
+class LLMResponseError(ValueError):
+    """LLM 응답을 기대한 형식(JSON 등)으로 해석할 수 없을 때 발생합니다."""
+
+    def __init__(self, message: str, raw: str = ""):
+        super().__init__(message)
+        self.raw = raw
+
+
+# 요청 제한: 동시 MAX_CONCURRENT_REQUESTS개까지 (분당 횟수 제한은 LLMService의 RateLimiter가 담당)
+# 에이전트의 LLM 워커 수도 이 값을 따름
+MAX_CONCURRENT_REQUESTS = 2
+_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
 
 class LLMService:
@@ -25,6 +38,7 @@ class LLMService:
         self.config = config or get_settings().llm
         self.provider = self.config.provider.lower()
         self.model = self.config.model
+        self._rate_limiter = RateLimiter(self.config.requests_per_minute, 60.0)
         logger.info(f"LLM 초기화: provider={self.provider}, model={self.model}")
 
     # ──────────────────────────────────────────
@@ -32,6 +46,8 @@ class LLMService:
     # ──────────────────────────────────────────
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
         """텍스트 생성. provider에 따라 분기합니다."""
+        # 쿼터 대기는 세마포어 밖에서 — 대기 중에 동시 실행 슬롯을 점유하지 않음
+        await self._rate_limiter.acquire()
         async with _SEMAPHORE:
             if self.provider == "gemini":
                 return await self._generate_gemini(system_prompt, user_prompt)
@@ -46,7 +62,7 @@ class LLMService:
     # JSON 구조화 응답
     # ──────────────────────────────────────────
     async def generate_json(self, system_prompt: str, user_prompt: str) -> dict:
-        """JSON 파싱이 포함된 텍스트 생성."""
+        """JSON 파싱이 포함된 텍스트 생성. 파싱 실패 시 LLMResponseError를 발생시킵니다."""
         raw = await self.generate(system_prompt, user_prompt)
         return _parse_json_response(raw)
 
@@ -65,52 +81,40 @@ class LLMService:
         Pydantic 모델 기반 구조화 응답.
         Gemini의 response_json_schema를 사용하여 타입 안전한 JSON 응답을 받습니다.
         """
+        if self.provider != "gemini":
+            # 다른 provider는 기존 generate_json 후 Pydantic 파싱
+            raw = await self.generate(system_prompt, user_prompt)
+            parsed = _parse_json_response(raw)
+            return response_model.model_validate(parsed)
+
+        await self._rate_limiter.acquire()
         async with _SEMAPHORE:
-            if self.provider == "gemini":
-                return await self._generate_gemini_structured(system_prompt, user_prompt, response_model)
-            else:
-                # 다른 provider는 기존 generate_json 후 Pydantic 파싱
-                raw = await self.generate(system_prompt, user_prompt)
-                parsed = _parse_json_response(raw)
-                return response_model.model_validate(parsed)
+            return await self._generate_gemini_structured(system_prompt, user_prompt, response_model)
 
     # ──────────────────────────────────────────
     # Gemini
     # ──────────────────────────────────────────
     async def _generate_gemini(self, system_prompt: str, user_prompt: str) -> str:
+        # str += 는 누적 버퍼를 매번 복사하므로 리스트에 모은 뒤 한 번에 결합
+        parts = [text async for text in self._stream_gemini(system_prompt, user_prompt)]
+        return "".join(parts)
+
+    async def _stream_gemini(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
         try:
-            from google import genai
-            from google.genai import types
+            import google.genai  # noqa: F401
         except ImportError:
             raise ImportError("google-genai 패키지가 필요합니다: pip install google-genai")
 
-        def _call():
-            client = genai.Client(api_key=self.config.api_key)
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=user_prompt)],
-                )
-            ]
-            config = types.GenerateContentConfig(
-                temperature=self.config.temperature,
-                top_p=0.1,
-                top_k=64,
-                response_mime_type="text/plain",
-                system_instruction=[types.Part.from_text(text=system_prompt)],
-            )
+        # 네이티브 async API 사용 — 스트리밍 동안 스레드풀 슬롯을 점유하지 않음
+        client = _get_gemini_client(self.config.api_key)
 
-            response_text = ""
-            for chunk in client.models.generate_content_stream(
-                model=self.model,
-                contents=contents,
-                config=config,
-            ):
-                if chunk.text:
-                    response_text += chunk.text
-            return response_text
-
-        return await asyncio.to_thread(_call)
+        async for chunk in await client.aio.models.generate_content_stream(
+            model=self.model,
+            contents=user_prompt,  # 문자열은 SDK가 user Content 하나로 감쌈
+            config=_gemini_text_config(system_prompt, self.config.temperature),
+        ):
+            if chunk.text:
+                yield chunk.text
 
     async def _generate_gemini_structured(
         self,
@@ -120,38 +124,32 @@ class LLMService:
     ) -> BaseModel:
         """Gemini structured output: Pydantic 스키마 기반 JSON 응답"""
         try:
-            from google import genai
-            from google.genai import types
+            import google.genai  # noqa: F401
         except ImportError:
             raise ImportError("google-genai 패키지가 필요합니다: pip install google-genai")
 
-        def _call():
-            client = genai.Client(api_key=self.config.api_key)
-            response = client.models.generate_content(
-                model=self.model,
-                contents=user_prompt,
-                config={
-                    "system_instruction": system_prompt,
-                    "response_mime_type": "application/json",
-                    "response_json_schema": response_model.model_json_schema(),
-                    "temperature": self.config.temperature,
-                },
-            )
-            return response_model.model_validate_json(response.text)
-
-        return await asyncio.to_thread(_call)
+        client = _get_gemini_client(self.config.api_key)
+        response = await client.aio.models.generate_content(
+            model=self.model,
+            contents=user_prompt,
+            config=_gemini_structured_config(
+                system_prompt, response_model, self.config.temperature
+            ),
+        )
+        return response_model.model_validate_json(response.text)
 
     # ──────────────────────────────────────────
     # OpenAI
     # ──────────────────────────────────────────
     async def _generate_openai(self, system_prompt: str, user_prompt: str) -> str:
         try:
-            from openai import OpenAI
+            import openai  # noqa: F401
         except ImportError:
             raise ImportError("openai 패키지가 필요합니다: pip install openai")
 
+        client = _get_openai_client(self.config.api_key)
+
         def _call():
-            client = OpenAI(api_key=self.config.api_key)
             response = client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -170,12 +168,13 @@ class LLMService:
     # ──────────────────────────────────────────
     async def _generate_anthropic(self, system_prompt: str, user_prompt: str) -> str:
         try:
-            from anthropic import Anthropic
+            import anthropic  # noqa: F401
         except ImportError:
             raise ImportError("anthropic 패키지가 필요합니다: pip install anthropic")
 
+        client = _get_anthropic_client(self.config.api_key)
+
         def _call():
-            client = Anthropic(api_key=self.config.api_key)
             response = client.messages.create(
                 model=self.model,
                 max_tokens=self.config.max_tokens,
@@ -187,19 +186,76 @@ class LLMService:
         return await asyncio.to_thread(_call)
 
 
+# ──────────────────────────────────────────────
+# 클라이언트 캐시 (호출마다 TLS 핸드셰이크/인증 초기화 방지)
+# ──────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
+def _get_gemini_client(api_key: str):
+    """API 키별 Gemini 클라이언트를 한 번만 생성하여 재사용합니다."""
+    from google import genai
+    return genai.Client(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client(api_key: str):
+    """OpenAI 클라이언트(내부 httpx 커넥션 풀 포함)를 스케줄러 실행 간 재사용합니다."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_anthropic_client(api_key: str):
+    """Anthropic 클라이언트를 스케줄러 실행 간 재사용합니다."""
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
+
+
+# 시스템 프롬프트는 에이전트별 상수이므로 요청 설정 객체도 프롬프트 단위로 재사용
+@functools.lru_cache(maxsize=32)
+def _gemini_text_config(system_prompt: str, temperature: float):
+    """텍스트 생성용 GenerateContentConfig를 시스템 프롬프트별로 한 번만 생성합니다."""
+    from google.genai import types
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        top_p=0.1,
+        top_k=64,
+        response_mime_type="text/plain",
+        system_instruction=[types.Part.from_text(text=system_prompt)],
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _gemini_structured_config(
+    system_prompt: str,
+    response_model: Type[BaseModel],
+    temperature: float,
+):
+    """구조화 응답용 GenerateContentConfig를 (프롬프트, 스키마)별로 한 번만 생성합니다."""
+    from google.genai import types
+    return types.GenerateContentConfig(
+        system_instruction=system_prompt,
+        response_mime_type="application/json",
+        response_json_schema=response_model.model_json_schema(),
+        temperature=temperature,
+    )
+
+
 # ──────────────────────────────────────────────
 # JSON 파싱 헬퍼
 # ──────────────────────────────────────────────
+_CODE_FENCE_LINE = re.compile(r"^[ \t]*```[^\n]*(?:\n|$)", re.MULTILINE)
+
+
 def _parse_json_response(raw: str) -> dict:
-    """LLM 응답에서 JSON을 추출합니다. 코드블록 래핑도 처리합니다."""
+    """
+    LLM 응답에서 JSON을 추출합니다. 코드블록 래핑도 처리합니다.
+    JSON을 찾지 못하면 LLMResponseError를 발생시킵니다.
+    """
     text = raw.strip()
 
-    # ```json ... ``` 코드블록 제거
+    # ```json ... ``` 코드블록 제거 (펜스 줄 전체를 한 번의 정규식 치환으로 삭제)
     if text.startswith("```"):
-        lines = text.split("\n")
-        # 첫 줄(```json)과 마지막 줄(```) 제거
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
+        text = _CODE_FENCE_LINE.sub("", text).strip()
 
     try:
         return json.loads(text)
@@ -213,8 +269,7 @@ def _parse_json_response(raw: str) -> dict:
             except json.JSONDecodeError:
                 pass
 
-        logger.error(f"JSON 파싱 실패: {text[:200]}...")
-        return {"error": "JSON 파싱 실패", "raw": text}
+        raise LLMResponseError(f"JSON 파싱 실패: {text[:200]}...", raw=text)
 
 
 # ──────────────────────────────────────────────
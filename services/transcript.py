@@ -5,35 +5,70 @@ YouTube 영상의 자막(transcript)을 가져옵니다.
 import logging
 import asyncio
 import random
+from functools import lru_cache
 from typing import Optional
 
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    NoTranscriptFound,
+    RequestBlocked,
+    TranscriptsDisabled,
+    VideoUnavailable,
+)
+from youtube_transcript_api.proxies import GenericProxyConfig
 
 from config.settings import get_settings
+from utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# youtube-transcript-api는 빠른 연속 요청 시 429를 반환하므로 호출 간격을 제한
+# (간격은 TRANSCRIPT_MIN_INTERVAL_SECONDS, 기본 1.5초)
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def _get_rate_limiter() -> RateLimiter:
+    global _rate_limiter
+    if _rate_limiter is None:
+        interval = get_settings().youtube.transcript_min_interval_seconds
+        _rate_limiter = RateLimiter(1, interval)
+    return _rate_limiter
+
+
+# ──────────────────────────────────────────────
+# API 인스턴스 캐시 (프록시별 requests.Session 커넥션 풀 재사용)
+# ──────────────────────────────────────────────
+@lru_cache(maxsize=16)
+def _get_api(proxy_url: Optional[str]) -> YouTubeTranscriptApi:
+    """
+    프록시 URL별 YouTubeTranscriptApi 인스턴스를 한 번만 생성합니다.
+    인스턴스는 내부 requests.Session을 유지하므로 호출마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    """
+    proxy_config = None
+    if proxy_url:
+        proxy_config = GenericProxyConfig(http_url=proxy_url, https_url=proxy_url)
+    return YouTubeTranscriptApi(proxy_config=proxy_config)
+
+
+def _pick_api() -> YouTubeTranscriptApi:
+    """WebShare Residential 프록시(1~10번) 중 하나를 골라 해당 API 인스턴스를 반환합니다."""
+    proxy_url = get_settings().youtube.proxy_url
+    if proxy_url:
+        proxy_url = proxy_url.replace("{id}", str(random.randint(1, 10)))
+    return _get_api(proxy_url or None)
+
 
 async def get_transcript(video_id: str, max_retries: int = 10) -> Optional[str]:
     """
     비디오 ID로부터 자막 텍스트를 가져옵니다.
     WebShare Residential 프록시 (1~10번)를 자동 교체하며 최대 10회 재시도합니다.
     """
-    subtitles_disabled_msg = "Subtitles are disabled for this video"
-    s = get_settings()
-    
     for attempt in range(max_retries):
-        proxies = None
-        if s.youtube.proxy_url:
-            proxy_url = s.youtube.proxy_url.replace("{id}", str(random.randint(1, 10)))
-            proxies = {"http": proxy_url, "https": proxy_url}
+        api = _pick_api()
 
         try:
-            transcript_list = await asyncio.to_thread(
-                YouTubeTranscriptApi.list_transcripts, 
-                video_id, 
-                proxies=proxies
-            )
+            await _get_rate_limiter().acquire()
+            transcript_list = await asyncio.to_thread(api.list, video_id)
             
             # Find any Korean transcript (manual or generated)
             ko_transcript = None
@@ -43,37 +78,49 @@ async def get_transcript(video_id: str, max_retries: int = 10) -> Optional[str]:
                         ko_transcript = tx # Prefer manual if both exist
             
             if not ko_transcript:
-                logger.info(f"자막 없음 (한국어 제외 다국어만 존재): {video_id}")
+                logger.info("자막 없음 (한국어 제외 다국어만 존재): %s", video_id)
                 return None
                 
-            data = ko_transcript.fetch()
-            text = " ".join(entry["text"] for entry in data)
-            logger.info(f"한국어 자막 추출 성공 ('{ko_transcript.language}', generated={ko_transcript.is_generated}, video_id={video_id})")
+            # fetch()도 동기 HTTP 요청이므로 스레드에서 실행 (이벤트 루프 블로킹 방지)
+            data = await asyncio.to_thread(ko_transcript.fetch)
+            text = " ".join(snippet.text for snippet in data)
+            logger.info(
+                "한국어 자막 추출 성공 ('%s', generated=%s, video_id=%s)",
+                ko_transcript.language, ko_transcript.is_generated, video_id,
+            )
             return text
             
-        except Exception as e:
-            if "Subtitles are disabled" in str(e):
-                logger.info(f"자막 비활성화: {video_id}")
-                return None
-            if "No transcripts were found" in str(e):
-                logger.info(f"자막 없음 (아예 없음): {video_id}")
+        # 재시도해도 결과가 같은 오류는 즉시 종료
+        except TranscriptsDisabled:
+            logger.info("자막 비활성화: %s", video_id)
+            return None
+        except NoTranscriptFound:
+            logger.info("자막 없음 (아예 없음): %s", video_id)
+            return None
+        except VideoUnavailable:
+            logger.info("영상 접근 불가: %s", video_id)
+            return None
+
+        # 429 Rate Limit / IP 차단(IpBlocked 포함) → 긴 대기 후 다른 프록시로 재시도
+        except RequestBlocked:
+            wait_time = random.uniform(20, 40)
+            logger.warning(
+                "YouTube 429 Rate Limit (시도 %d/%d), %.0f초 대기...",
+                attempt + 1, max_retries, wait_time,
+            )
+            if attempt < max_retries - 1:
+                await asyncio.sleep(wait_time)
+            else:
+                logger.error("자막 가져오기 최종 실패 (429 Rate Limit): %s", video_id)
                 return None
 
-            # 429 Rate Limit → 긴 대기 후 재시도
-            if "Too Many Requests" in str(e) or "429" in str(e):
-                wait_time = random.uniform(20, 40)
-                logger.warning(f"YouTube 429 Rate Limit (시도 {attempt + 1}/{max_retries}), {wait_time:.0f}초 대기...")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"자막 가져오기 최종 실패 (429 Rate Limit): {video_id}")
-                    return None
-
-            # ProxyError나 Timeout 등 기타 오류는 짧게 대기 후 새 프록시로 즉시 재시도
-            logger.warning(f"자막 오류 (시도 {attempt + 1}/{max_retries}): {type(e).__name__} - 프록시 자동 교체 진행")
-            import traceback
-            traceback.print_exc()
+        # ProxyError나 Timeout 등 기타 오류는 짧게 대기 후 새 프록시로 즉시 재시도
+        except Exception as e:
+            logger.warning(
+                "자막 오류 (시도 %d/%d): %s - 프록시 자동 교체 진행",
+                attempt + 1, max_retries, type(e).__name__,
+                exc_info=True,
+            )
             if attempt < max_retries - 1:
                 await asyncio.sleep(random.uniform(0.5, 2.0))
 
@@ -85,17 +132,10 @@ async def check_subtitle_available(video_id: str) -> str:
     자막 존재 여부만 빠르게 확인합니다.
     """
     try:
-        s = get_settings()
-        proxies = None
-        if s.youtube.proxy_url:
-            proxy_url = s.youtube.proxy_url.replace("{id}", str(random.randint(1, 10)))
-            proxies = {"http": proxy_url, "https": proxy_url}
-        
-        transcript_list = await asyncio.to_thread(
-            YouTubeTranscriptApi.list_transcripts, 
-            video_id, 
-            proxies=proxies
-        )
+        api = _pick_api()
+
+        await _get_rate_limiter().acquire()
+        transcript_list = await asyncio.to_thread(api.list, video_id)
         
         ko_exists = False
         for tx in transcript_list:
@@ -104,13 +144,11 @@ async def check_subtitle_available(video_id: str) -> str:
                 break
                 
         return "Y" if ko_exists else "N"
+    except (TranscriptsDisabled, NoTranscriptFound):
+        return "N"
+    except RequestBlocked:
+        logger.warning("[check_subtitle] 429 Rate Limit for %s → 임시 'Y' 처리", video_id)
+        return "Y"
     except Exception as e:
-        if "Subtitles are disabled" in str(e):
-            return "N"
-        if "No transcripts were found" in str(e):
-            return "N"
-        if "Too Many Requests" in str(e) or "429" in str(e):
-            logger.warning(f"[check_subtitle] 429 Rate Limit for {video_id} → 임시 'Y' 처리")
-            return "Y"
-        logger.warning(f"[check_subtitle] {video_id}: {type(e).__name__}")
+        logger.warning("[check_subtitle] %s: %s", video_id, type(e).__name__)
         return "미확인"
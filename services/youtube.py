@@ -4,13 +4,17 @@ YouTube 스크래핑 서비스
 채널 페이지 스크래핑 → 최신 영상 목록 추출에 초점을 맞춥니다.
 """
 import re
-import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+import random
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 import httpx
+import orjson
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
@@ -29,6 +33,144 @@ _HEADERS = {
     "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
 }
 
+# ──────────────────────────────────────────────
+# 공용 HTTP 클라이언트 (요청마다 TCP/TLS 연결을 새로 맺지 않도록 재사용)
+# ──────────────────────────────────────────────
+_client: Optional[httpx.AsyncClient] = None
+
+# HTTP/2: 채널 페이지·RSS 요청을 youtube.com 연결 하나에 다중화 (h2 패키지가 없으면 HTTP/1.1)
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=_HEADERS,
+            follow_redirects=True,
+            http2=_HTTP2,
+            limits=_LIMITS,
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """공용 HTTP 클라이언트를 닫습니다. 앱 종료 시 호출합니다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# ──────────────────────────────────────────────
+# 채널 ID 캐시 (채널 URL → UC... ID, 사실상 변하지 않음)
+# 별도 조회 요청 없이 스크래핑한 채널 페이지에서만 채워지며, RSS 빠른 경로가 사용
+# ──────────────────────────────────────────────
+# 응답 본문(bytes)에 바로 적용 — 수 MB HTML을 str로 디코딩하지 않음
+_CHANNEL_ID_PATTERNS = (
+    re.compile(rb'"externalId":"(UC[\w-]{22})"'),
+    re.compile(rb'<link rel="canonical" href="https://www\.youtube\.com/channel/(UC[\w-]{22})"'),
+)
+_CHANNEL_TAB_SUFFIX = re.compile(r"/(?:videos|streams|featured)$")
+_YOUTUBE_HOSTS = frozenset({"youtube.com", "www.youtube.com", "m.youtube.com"})
+
+# 핸들(@...)은 드물게 다른 채널로 재할당될 수 있으므로 만료 후 다음 스크래핑 페이지에서 다시 채움
+_CHANNEL_ID_TTL_SECONDS = 3600.0
+
+# 채널 기준 URL → (채널 ID, 캐시 시각[monotonic])
+_channel_ids: Dict[str, Tuple[str, float]] = {}
+
+
+def _channel_key(url: str) -> str:
+    """
+    채널 기준 URL. 같은 채널을 가리키는 표기 차이를 하나로 모읍니다.
+    (호스트 소문자화, youtube.com/m.youtube.com → www.youtube.com, 쿼리·탭 경로·끝 슬래시 제거)
+    """
+    url = url.strip()
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower()
+    if host in _YOUTUBE_HOSTS:
+        host = "www.youtube.com"
+    path = _CHANNEL_TAB_SUFFIX.sub("", parts.path.rstrip("/"))
+    return f"{parts.scheme.lower() or 'https'}://{host}{path}"
+
+
+def _cached_channel_id(key: str) -> Optional[str]:
+    """TTL 안에 있는 캐시된 채널 ID를 반환합니다."""
+    entry = _channel_ids.get(key)
+    if entry is None:
+        return None
+    channel_id, cached_at = entry
+    if time.monotonic() - cached_at > _CHANNEL_ID_TTL_SECONDS:
+        del _channel_ids[key]
+        return None
+    return channel_id
+
+
+def _remember_channel_id(url: str, html: bytes) -> Optional[str]:
+    """채널 페이지 HTML에서 채널 ID를 찾아 캐시합니다. 이미 받은 페이지를 재활용하므로 추가 요청 없음."""
+    key = _channel_key(url)
+    cached = _cached_channel_id(key)
+    if cached:
+        return cached
+    for pat in _CHANNEL_ID_PATTERNS:
+        m = pat.search(html)
+        if m:
+            channel_id = m.group(1).decode("ascii")
+            _channel_ids[key] = (channel_id, time.monotonic())
+            return channel_id
+    return None
+
+
+# ──────────────────────────────────────────────
+# RSS 피드 (신규 업로드 여부 빠른 확인용, 수 KB)
+# ──────────────────────────────────────────────
+_FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+_FEED_VIDEO_ID_TAG = "{http://www.youtube.com/xml/schemas/2015}videoId"
+
+# 같은 채널 URL이 키워드만 다르게 여러 행으로 등록될 수 있으므로 (채널 기준 URL, 소문자 키워드) 단위로 관리
+# 값: (피드 영상 ID 집합, 라이브/예정 영상 존재 여부)
+_FeedKey = Tuple[str, str]
+
+# 호출부가 결과 처리를 확정(commit_feed_state)한 마지막 상태 — '변화 없음' 판정 기준
+_feed_state: Dict[_FeedKey, Tuple[frozenset, bool]] = {}
+# 스크래핑은 성공했지만 아직 확정되지 않은 상태
+_pending_feed_state: Dict[_FeedKey, Tuple[frozenset, bool]] = {}
+
+
+def _feed_key(channel_url: str, keyword: Optional[str]) -> _FeedKey:
+    return _channel_key(channel_url), (keyword or "").lower()
+
+
+def commit_feed_state(channel_url: str, keyword: Optional[str] = None) -> None:
+    """
+    skip_if_unchanged=True로 가져온 결과를 호출부가 모두 처리(등록)했을 때 호출합니다.
+    확정된 뒤에야 같은 피드를 '변화 없음'으로 보고 스크래핑을 생략하므로,
+    처리에 실패한 영상은 다음 회차에 다시 반환됩니다.
+    """
+    key = _feed_key(channel_url, keyword)
+    state = _pending_feed_state.pop(key, None)
+    if state is not None:
+        _feed_state[key] = state
+
+
+async def _fetch_feed_video_ids(channel_id: str, timeout: float) -> Optional[frozenset]:
+    """채널 RSS 피드의 영상 ID 집합을 반환합니다. 실패 시 None (스크래핑으로 진행)."""
+    try:
+        resp = await _get_client().get(_FEED_URL.format(channel_id), timeout=timeout)
+        resp.raise_for_status()
+        root = ElementTree.fromstring(resp.content)
+    except Exception as e:
+        logger.debug("RSS 피드 조회 실패 (%s): %s", channel_id, e)
+        return None
+    return frozenset(el.text for el in root.iter(_FEED_VIDEO_ID_TAG) if el.text)
+
 
 # ──────────────────────────────────────────────
 # 메인 API: 채널에서 최신 영상 목록 가져오기
@@ -38,11 +180,16 @@ async def get_latest_videos(
     keyword: Optional[str] = None,
     max_retries: int = 3,
     timeout: float = 30.0,
+    skip_if_unchanged: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     채널 URL을 스크래핑하여 영상 목록을 가져옵니다.
     keyword가 주어지면 제목에 키워드가 포함된 영상만 반환합니다.
 
+    skip_if_unchanged=True이면 먼저 RSS 피드를 확인하여, 마지막으로 확정된 회차 이후
+    피드의 영상 구성이 같고 당시 라이브/예정 영상도 없었다면 스크래핑 없이 빈 리스트를
+    반환합니다. (신규 영상만 필요한 채널 모니터용 — 결과 처리 후 commit_feed_state 호출)
+
     Returns:
         영상 정보 리스트 [{title, url, video_id, upload_date, video_length,
                           duration_seconds, is_upcoming, is_live}, ...]
@@ -50,24 +197,57 @@ async def get_latest_videos(
     all_videos = []
     base_url = channel_url.rstrip("/")
 
+    # 채널 ID는 이전 스크래핑에서 캐시된 경우에만 사용 (ID 조회용 추가 요청은 하지 않음)
+    channel_id = _cached_channel_id(_channel_key(base_url)) if skip_if_unchanged else None
+    feed_key = _feed_key(base_url, keyword)
+    feed_ids = None
+    if channel_id:
+        feed_ids = await _fetch_feed_video_ids(channel_id, timeout)
+        state = _feed_state.get(feed_key)
+        if feed_ids and state and state == (feed_ids, False):
+            logger.debug("피드 변화 없음, 스크래핑 생략: %s", base_url)
+            return []
+
+    now = datetime.now(KST)
+    max_age = timedelta(hours=24)
+
+    def _too_old(v: Dict[str, Any]) -> bool:
+        # 탭은 최신순이므로 기준보다 오래된 영상이 나오면 그 뒤는 볼 필요가 없음
+        # (라이브/예정은 게시 시각이 없어 now로 해석되므로 여기서 멈추지 않음)
+        return now - parse_upload_date(v["upload_date"], now) > max_age
+
     # URL에 이미 /videos나 /streams가 포함된 경우 해당 탭만 크롤링
     if any(p in base_url for p in ["/videos", "/streams"]):
-        videos = await _scrape_channel_page(base_url, keyword, max_retries, timeout)
-        if videos:
-            all_videos.extend(videos)
+        tab_urls = [base_url]
     else:
-        # 두 탭 모두 크롤링하여 합침
-        for path_suffix in ["/videos", "/streams"]:
-            target_url = f"{base_url}{path_suffix}"
-            videos = await _scrape_channel_page(target_url, keyword, max_retries, timeout)
-            if videos:
-                all_videos.extend(videos)
+        # 두 탭을 동시에 크롤링하여 합침 (순서는 /videos → /streams 유지)
+        tab_urls = [f"{base_url}{path_suffix}" for path_suffix in ["/videos", "/streams"]]
+
+    results = await asyncio.gather(*[
+        _scrape_channel_page(url, keyword, max_retries, timeout, stop_on=_too_old)
+        for url in tab_urls
+    ])
+    for videos in results:
+        all_videos.extend(videos or [])
+
+    # 모든 탭을 파싱했을 때만 피드 상태 기록 (매칭 영상이 없어도 기준으로 삼음)
+    # 한 탭이라도 실패한 회차를 '변화 없음'의 기준으로 삼으면 그 탭의 신규 영상을 놓침
+    # 라이브/예정 영상은 종료 후 같은 ID로 일반 영상이 되므로, 있으면 다음 회차에도 스크래핑
+    # 호출부가 commit_feed_state로 확정하기 전까지는 보류 상태로만 둠
+    if feed_ids and all(videos is not None for videos in results):
+        has_pending = any(v.get("is_live") or v.get("is_upcoming") for v in all_videos)
+        _pending_feed_state[feed_key] = (feed_ids, has_pending)
+    else:
+        _pending_feed_state.pop(feed_key, None)
 
     # 중복 제거 (video_id 기준) 및 필터링 (라이브 제외, 15분 미만 제외, 3일 이상 제외)
     unique_videos = {}
-    now = datetime.now(KST)
-    
+
     for v in all_videos:
+        # 0. 두 탭에 중복 노출된 영상은 이미 판정했으므로 건너뜀
+        if v["video_id"] in unique_videos:
+            continue
+
         # 1. 라이브/예정 제외
         if v.get("is_live") or v.get("is_upcoming"):
             continue
@@ -78,8 +258,8 @@ async def get_latest_videos(
             continue
             
         # 3. 24시간 이전 영상 제외
-        upload_dt = parse_upload_date(v.get("upload_date", ""))
-        if (now - upload_dt).total_seconds() > 24 * 3600:
+        upload_dt = parse_upload_date(v.get("upload_date", ""), now)
+        if now - upload_dt > max_age:
             continue
             
         unique_videos[v["video_id"]] = v
@@ -90,35 +270,32 @@ async def get_latest_videos(
     return sorted_videos
 
 
-async def find_best_video(
-    channel_url: str,
-    keyword: str,
-    max_retries: int = 3,
-) -> Optional[Dict[str, Any]]:
-    """
-    채널에서 키워드에 맞는 최적의 영상 하나를 반환합니다.
-    우선순위: 라이브 중 > 일반(5분 이상) > 라이브 예정
+async def get_latest_videos_batch(
+    channels: List[Tuple[str, Optional[str]]],
+    concurrency: int = 16,
+    **kwargs: Any,
+) -> List[Any]:
     """
-    videos = await get_latest_videos(channel_url, keyword, max_retries)
-    if not videos:
-        return None
+    여러 채널의 get_latest_videos를 동시에 실행합니다. (동시 실행 수는 concurrency로 제한)
+    공용 HTTP/2 클라이언트를 공유하므로 요청이 같은 연결 위에서 다중화됩니다.
 
-    live = [v for v in videos if v.get("is_live")]
-    upcoming = [v for v in videos if v.get("is_upcoming")]
-    normal = [v for v in videos if not v.get("is_live") and not v.get("is_upcoming")]
+    Args:
+        channels: [(channel_url, keyword), ...]
+        kwargs: get_latest_videos에 그대로 전달 (timeout, skip_if_unchanged 등)
 
-    # 일반 영상 중 5분(300초) 이상만
-    normal_filtered = [v for v in normal if v.get("duration_seconds", 0) >= 300]
+    Returns:
+        channels와 같은 순서의 결과 리스트. 실패한 채널 자리에는 예외 객체가 들어갑니다.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
 
-    if live:
-        return live[0]
-    if normal_filtered:
-        return normal_filtered[0]
-    if upcoming:
-        return upcoming[0]
+    async def _one(channel_url: str, keyword: Optional[str]) -> List[Dict[str, Any]]:
+        async with sem:
+            return await get_latest_videos(channel_url, keyword, **kwargs)
 
-    logger.warning("적합한 영상 없음 (모두 5분 이하 또는 비어있음)")
-    return None
+    return await asyncio.gather(
+        *[_one(url, keyword) for url, keyword in channels],
+        return_exceptions=True,
+    )
 
 
 # ──────────────────────────────────────────────
@@ -129,56 +306,91 @@ async def _scrape_channel_page(
     keyword: Optional[str],
     max_retries: int,
     timeout: float,
-) -> List[Dict[str, Any]]:
+    stop_on: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    채널 탭 페이지 하나를 스크래핑합니다.
+    페이지를 파싱했으면 (매칭 영상이 없더라도) 리스트를, 재시도 후에도 실패하면 None을 반환합니다.
+    """
     for attempt in range(max_retries):
+        retry_after = None
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    url, headers=_HEADERS, follow_redirects=True, timeout=timeout
-                )
+            resp = await _get_client().get(url, timeout=timeout)
+
+            if resp.status_code in _RETRYABLE_STATUS:
+                retry_after = resp.headers.get("Retry-After")
+                logger.debug("HTTP %d: %s (시도 %d)", resp.status_code, url, attempt + 1)
+            else:
+                # 그 밖의 4xx(잘못된 채널 URL 등)는 재시도해도 같으므로 즉시 포기
                 resp.raise_for_status()
+                _remember_channel_id(url, resp.content)
+
+                # 페이지를 정상 파싱했다면 매칭 영상이 없어도 결과가 확정된 것이므로 재시도하지 않음
+                # (재시도는 ytInitialData를 찾지 못한 불완전 응답에만)
+                data = _extract_initial_data(resp.content)
+                if data:
+                    return _find_videos(data, keyword, stop_on)
+                logger.debug("ytInitialData 없음: %s (시도 %d)", url, attempt + 1)
+
+        except httpx.HTTPStatusError as e:
+            logger.error("스크래핑 실패 (HTTP %d): %s", e.response.status_code, url)
+            return None
+        except httpx.TimeoutException:
+            logger.debug("타임아웃: %s (시도 %d)", url, attempt + 1)
+        except Exception:
+            logger.debug("스크래핑 오류: %s (시도 %d)", url, attempt + 1, exc_info=True)
+
+        if attempt < max_retries - 1:
+            await asyncio.sleep(_retry_delay(attempt, retry_after))
 
-            data = _extract_initial_data(resp.text)
-            if not data:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                return []
+    # 시도별 사유는 DEBUG로만 남기고, 최종 실패만 한 번 경고
+    logger.warning("스크래핑 최종 실패 (%d회 시도): %s", max_retries, url)
+    return None
 
-            videos = _find_videos(data, keyword)
-            if videos:
-                return videos
 
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
+# 일시적 오류로 보고 재시도하는 HTTP 상태 코드
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_AFTER = 60.0
 
-        except httpx.TimeoutException:
-            logger.warning(f"타임아웃: {url} (시도 {attempt + 1})")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-        except Exception as e:
-            logger.error(f"스크래핑 오류: {e}")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
 
-    return []
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    재시도 대기 시간(초). Retry-After(초 단위)가 있으면 따르고,
+    없으면 지수 백오프에 지터를 더해 여러 채널의 재시도가 한꺼번에 몰리지 않게 합니다.
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP-date 형식은 무시하고 백오프 사용
+    return 2 ** attempt + random.uniform(0, 1)
 
 
 # ──────────────────────────────────────────────
 # 내부: ytInitialData 추출
 # ──────────────────────────────────────────────
-def _extract_initial_data(html: str) -> dict:
-    patterns = [
-        re.compile(r'var\s+ytInitialData\s*=\s*(\{.+?\});</script>', re.DOTALL),
-        re.compile(r'window\["ytInitialData"\]\s*=\s*(\{.+?\});', re.DOTALL),
-        re.compile(r'ytInitialData\s*=\s*(\{.+?\});', re.DOTALL),
-    ]
-    for pat in patterns:
-        m = pat.search(html)
+# bytes 패턴: 응답 본문을 str로 디코딩하지 않고 검색, 매치 결과도 bytes 그대로 orjson에 전달
+_YT_INITIAL_DATA_PATTERNS = (
+    re.compile(rb'var\s+ytInitialData\s*=\s*(\{.+?\});</script>', re.DOTALL),
+    re.compile(rb'window\["ytInitialData"\]\s*=\s*(\{.+?\});', re.DOTALL),
+    re.compile(rb'ytInitialData\s*=\s*(\{.+?\});', re.DOTALL),
+)
+
+
+def _extract_initial_data(html: bytes) -> dict:
+    # 오류/동의 페이지 등 ytInitialData가 아예 없는 응답은 정규식(.+? DOTALL) 전체 탐색 없이 바로 종료
+    anchor = html.find(b"ytInitialData")
+    if anchor < 0:
+        return {}
+    # 모든 패턴은 첫 등장 위치 직전('var ', 'window["')부터 시작하므로 그 앞 본문은 다시 훑지 않음
+    start = max(anchor - 32, 0)
+    for pat in _YT_INITIAL_DATA_PATTERNS:
+        m = pat.search(html, start)
         if m:
             try:
-                return json.loads(m.group(1))
-            except json.JSONDecodeError:
+                # ytInitialData는 수 MB에 달하므로 C 구현 orjson으로 파싱
+                return orjson.loads(m.group(1))
+            except orjson.JSONDecodeError:
                 continue
     return {}
 
@@ -186,90 +398,110 @@ def _extract_initial_data(html: str) -> dict:
 # ──────────────────────────────────────────────
 # 내부: 비디오 목록 추출
 # ──────────────────────────────────────────────
-def _find_videos(data: dict, keyword: Optional[str]) -> List[Dict[str, Any]]:
+def _find_videos(
+    data: dict,
+    keyword: Optional[str],
+    stop_on: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    키워드에 맞는 영상을 페이지 순서대로 모읍니다.
+    stop_on이 주어지면 그 조건을 만족하는 영상을 담은 직후 순회를 멈춥니다. (남은 렌더러는 방문하지 않음)
+    """
     videos: list = []
+    keyword_lower = keyword.lower() if keyword else ""  # 렌더러마다 다시 소문자화하지 않도록 한 번만
 
-    # 비디오 렌더러들을 재귀적으로 수집
-    renderers = _collect_video_renderers(data)
-
-    for renderer in renderers:
-        title = _extract_title(renderer)
-        if keyword and keyword.lower() not in title.lower():
-            continue
-
-        video_id = renderer.get("videoId", "")
-        if not video_id:
+    for renderer in _iter_video_renderers(data):
+        video = _build_video_entry(renderer, keyword_lower)
+        if video is None:
             continue
+        videos.append(video)
+        if stop_on is not None and stop_on(video):
+            break
 
-        is_upcoming, is_live = _check_live_status(renderer)
-        video_length, duration_seconds = _extract_duration(renderer)
-        upload_time = ""
-        if "publishedTimeText" in renderer:
-            upload_time = renderer["publishedTimeText"].get("simpleText", "")
-
-        videos.append({
-            "title": title,
-            "url": f"https://www.youtube.com/watch?v={video_id}",
-            "video_id": video_id,
-            "upload_date": upload_time,
-            "is_upcoming": is_upcoming,
-            "is_live": is_live,
-            "video_length": video_length,
-            "duration_seconds": duration_seconds,
-        })
-
-    # 정렬: 라이브 > 일반 > 예정
-    videos.sort(key=lambda v: (-1 if v["is_live"] else (1 if v["is_upcoming"] else 0)))
+    # 우선순위 정렬은 하지 않음 — get_latest_videos가 라이브/예정을 제외하므로 페이지 순서(최신순)를 그대로 반환
     return videos
 
 
-def _collect_video_renderers(obj: Any, depth: int = 0) -> List[dict]:
-    """JSON 트리에서 videoRenderer / gridVideoRenderer를 재귀적으로 수집"""
-    if depth > 15 or not isinstance(obj, (dict, list)):
-        return []
+def _build_video_entry(renderer: dict, keyword_lower: str) -> Optional[Dict[str, Any]]:
+    """
+    videoRenderer / gridVideoRenderer 하나를 영상 정보 dict로 변환합니다.
+    제목에 키워드(소문자)가 없거나 videoId가 없으면 None.
+    """
+    title = _extract_title(renderer)
+    if keyword_lower and keyword_lower not in title.lower():
+        return None
+
+    video_id = renderer.get("videoId", "")
+    if not video_id:
+        return None
+
+    is_upcoming, is_live = _check_live_status(renderer)
+    video_length, duration_seconds = _extract_duration(renderer)
+    upload_time = ""
+    if "publishedTimeText" in renderer:
+        upload_time = renderer["publishedTimeText"].get("simpleText", "")
+
+    return {
+        "title": title,
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "video_id": video_id,
+        "upload_date": upload_time,
+        "is_upcoming": is_upcoming,
+        "is_live": is_live,
+        "video_length": video_length,
+        "duration_seconds": duration_seconds,
+    }
+
+
+_RENDERER_KEYS = ("videoRenderer", "gridVideoRenderer")
 
-    results = []
+
+def _iter_video_renderers(obj: Any, depth: int = 0) -> Iterator[dict]:
+    """JSON 트리를 깊이 우선으로 순회하며 videoRenderer / gridVideoRenderer를 차례로 반환
+    (단계마다 중간 리스트를 만들지 않으며, 렌더러 내부로는 내려가지 않음)"""
+    if depth > 15:
+        return
     if isinstance(obj, dict):
-        for key in ("videoRenderer", "gridVideoRenderer"):
-            if key in obj:
-                results.append(obj[key])
-        for v in obj.values():
-            results.extend(_collect_video_renderers(v, depth + 1))
+        for key, value in obj.items():
+            if key in _RENDERER_KEYS:
+                yield value
+            elif isinstance(value, (dict, list)):
+                yield from _iter_video_renderers(value, depth + 1)
     elif isinstance(obj, list):
         for item in obj:
-            results.extend(_collect_video_renderers(item, depth + 1))
-    return results
+            if isinstance(item, (dict, list)):
+                yield from _iter_video_renderers(item, depth + 1)
 
 
 def _extract_title(renderer: dict) -> str:
-    title = ""
-    if "title" in renderer:
-        if "runs" in renderer["title"]:
-            for run in renderer["title"]["runs"]:
-                title += run.get("text", "")
-        elif "simpleText" in renderer["title"]:
-            title = renderer["title"]["simpleText"]
-    return title
+    title = renderer.get("title")
+    if not title:
+        return ""
+    if "runs" in title:
+        return "".join(run.get("text", "") for run in title["runs"])
+    return title.get("simpleText", "")
+
+
+# 썸네일 오버레이 / 배지 style → 해당하는 상태 플래그
+_OVERLAY_STATUS_FLAGS = {"UPCOMING": "is_upcoming", "LIVE": "is_live"}
+_BADGE_STATUS_FLAGS = {"BADGE_STYLE_TYPE_LIVE_NOW": "is_live"}
 
 
 def _check_live_status(renderer: dict) -> tuple:
-    is_upcoming = False
-    is_live = False
+    flags = {"is_upcoming": False, "is_live": False}
 
-    for overlay in renderer.get("thumbnailOverlays", []):
-        status = overlay.get("thumbnailOverlayTimeStatusRenderer", {})
-        style = status.get("style", "")
-        if style == "UPCOMING":
-            is_upcoming = True
-        elif style == "LIVE":
-            is_live = True
+    for overlay in renderer.get("thumbnailOverlays", ()):
+        style = overlay.get("thumbnailOverlayTimeStatusRenderer", {}).get("style")
+        flag = _OVERLAY_STATUS_FLAGS.get(style)
+        if flag:
+            flags[flag] = True
 
-    for badge in renderer.get("badges", []):
-        meta = badge.get("metadataBadgeRenderer", {})
-        if meta.get("style") == "BADGE_STYLE_TYPE_LIVE_NOW":
-            is_live = True
+    for badge in renderer.get("badges", ()):
+        flag = _BADGE_STATUS_FLAGS.get(badge.get("metadataBadgeRenderer", {}).get("style"))
+        if flag:
+            flags[flag] = True
 
-    return is_upcoming, is_live
+    return flags["is_upcoming"], flags["is_live"]
 
 
 def _extract_duration(renderer: dict) -> tuple:
@@ -282,69 +514,77 @@ def _extract_duration(renderer: dict) -> tuple:
     return video_length, duration_seconds
 
 
+_DURATION_PATTERN = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+)")
+
+
 def _parse_duration_text(text: str) -> int:
-    """'10:30' → 630초"""
-    try:
-        parts = text.split(":")
-        if len(parts) == 3:
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-        elif len(parts) == 2:
-            return int(parts[0]) * 60 + int(parts[1])
-        return int(parts[0])
-    except (ValueError, IndexError):
+    """'10:30' → 630초, '1:02:03' → 3723초 (형식이 맞지 않으면 0)"""
+    m = _DURATION_PATTERN.fullmatch(text.strip())
+    if not m:
         return 0
+    hours, minutes, seconds = m.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds)
 
 
 # ──────────────────────────────────────────────
 # 업로드 날짜 파싱 (상대 시간 → KST datetime)
 # ──────────────────────────────────────────────
-def parse_upload_date(upload_time_text: str) -> datetime:
-    """'3일 전', '5시간 전' 등을 KST datetime으로 변환합니다."""
-    now = datetime.now(KST)
+_NUMBER_PATTERN = re.compile(r"(\d+)")
+_KO_DATE_PATTERN = re.compile(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일")   # 2024년 3월 13일
+_EN_DATE_PATTERN = re.compile(r"([A-Za-z]{3})\s*(\d{1,2}),?\s*(\d{4})")    # Mar 13, 2024
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+# 상대 시간 표현 → 단위 시간 (값을 곱해서 사용)
+_RELATIVE_UNITS = (
+    (("분 전", "minutes ago"), timedelta(minutes=1)),
+    (("시간 전", "hours ago"), timedelta(hours=1)),
+    (("일 전", "days ago"), timedelta(days=1)),
+    (("주 전", "weeks ago"), timedelta(weeks=1)),
+    (("개월 전", "months ago"), timedelta(days=30)),
+    (("년 전", "years ago"), timedelta(days=365)),
+)
+
+
+def parse_upload_date(upload_time_text: str, now: Optional[datetime] = None) -> datetime:
+    """
+    '3일 전', '5시간 전' 등을 KST datetime으로 변환합니다.
+    여러 영상을 한 번에 처리할 때는 기준 시각 now를 넘겨 호출마다 시각을 다시 구하지 않도록 합니다.
+    """
+    if now is None:
+        now = datetime.now(KST)
     if not upload_time_text:
         return now
 
     # "스트리밍 시간:" 접두어 제거
     text = upload_time_text.replace("스트리밍 시간:", "").strip()
 
-    num_match = re.search(r"(\d+)", text)
+    num_match = _NUMBER_PATTERN.search(text)
     if not num_match:
         # 직접 날짜 형식 시도
         return _try_parse_absolute_date(text) or now
 
     value = int(num_match.group(1))
 
-    time_units = {
-        ("분 전", "minutes ago"): timedelta(minutes=value),
-        ("시간 전", "hours ago"): timedelta(hours=value),
-        ("일 전", "days ago"): timedelta(days=value),
-        ("주 전", "weeks ago"): timedelta(weeks=value),
-        ("개월 전", "months ago"): timedelta(days=value * 30),
-        ("년 전", "years ago"): timedelta(days=value * 365),
-    }
-
-    for keywords, delta in time_units.items():
+    for keywords, unit in _RELATIVE_UNITS:
         if any(kw in text for kw in keywords):
-            return now - delta
+            return now - unit * value
 
     return _try_parse_absolute_date(text) or now
 
 
 def _try_parse_absolute_date(text: str) -> Optional[datetime]:
     # 한국어: 2024년 3월 13일
-    m = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", text)
+    m = _KO_DATE_PATTERN.search(text)
     if m:
         y, mo, d = map(int, m.groups())
         return datetime(y, mo, d, tzinfo=KST)
 
     # 영어: Mar 13, 2024
-    m = re.search(r"([A-Za-z]{3})\s*(\d{1,2}),?\s*(\d{4})", text)
+    m = _EN_DATE_PATTERN.search(text)
     if m:
-        month_map = {
-            "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
-            "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
-        }
-        mo = month_map.get(m.group(1), 1)
+        mo = _MONTHS.get(m.group(1), 1)
         return datetime(int(m.group(3)), mo, int(m.group(2)), tzinfo=KST)
 
     return None
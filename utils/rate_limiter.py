@@ -0,0 +1,44 @@
+"""
+비동기 요청 제한기
+고정 sleep 대신 최근 호출 시각을 추적하는 슬라이딩 윈도우 방식으로
+외부 API 호출 빈도를 제한합니다.
+"""
+import asyncio
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """period초 동안 최대 max_calls회 호출을 허용하는 슬라이딩 윈도우 제한기.
+    max_calls가 0 이하이면 제한하지 않습니다."""
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """호출 슬롯이 생길 때까지 대기한 뒤 현재 시각을 기록합니다."""
+        if self.max_calls <= 0:
+            return
+
+        # Lock으로 대기 순서를 보장 (먼저 온 호출이 먼저 슬롯을 얻음)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -2,14 +2,21 @@
 시간 처리를 위한 유틸리티 함수들
 다양한 형식의 시간 입력을 처리하고 일관된 KST 시간으로 변환
 """
+import logging
+import sys
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Union
 from zoneinfo import ZoneInfo
 
+logger = logging.getLogger(__name__)
+
 # KST 시간대 정의
 KST = ZoneInfo("Asia/Seoul")
 UTC = timezone.utc
 
+# Python 3.11부터 datetime.fromisoformat이 'Z' 접미사를 직접 처리
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 def parse_iso_datetime(iso_str: str) -> Optional[datetime]:
     """
     ISO 8601 형식 문자열을 datetime 객체로 변환
@@ -21,8 +28,8 @@ def parse_iso_datetime(iso_str: str) -> Optional[datetime]:
         datetime 객체 또는 None (파싱 실패 시)
     """
     try:
-        # 'Z' 표기는 UTC를 의미 - '+00:00'으로 대체
-        if 'Z' in iso_str:
+        # 'Z' 표기는 UTC를 의미 - 3.11 미만의 fromisoformat은 지원하지 않으므로 '+00:00'으로 대체
+        if not _FROMISOFORMAT_ACCEPTS_Z and 'Z' in iso_str:
             iso_str = iso_str.replace('Z', '+00:00')
             
         # ISO 문자열 파싱 - timezone 정보 보존
@@ -34,7 +41,7 @@ def parse_iso_datetime(iso_str: str) -> Optional[datetime]:
             
         return dt
     except Exception as e:
-        print(f"ISO 날짜 파싱 오류: {str(e)}")
+        logger.warning(f"ISO 날짜 파싱 오류: {str(e)}")
         return None
 
 def convert_to_kst_datetime(time_input: Union[str, datetime, None]) -> datetime: